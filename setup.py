@@ -0,0 +1,24 @@
+"""Optional mypyc build of the baseline rule engine and traceability matrix.
+
+Metadata lives in pyproject.toml; this file only adds compiled extensions.
+With TESTGEN_MYPYC=1 and mypy available (e.g.
+``TESTGEN_MYPYC=1 pip install --no-build-isolation .``) both modules are
+compiled with mypyc. Otherwise the build is plain setuptools and they stay
+pure Python; the imports are the same either way.
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("TESTGEN_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "src/testgenai/rules/rule_engine.py",
+            "src/testgenai/mapping/traceability.py",
+        ]
+    )
+
+setup(ext_modules=ext_modules)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import mmap
 import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List
 
 import yaml
 
@@ -59,6 +61,33 @@ def _read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="ignore")
 
 
+class _MappedFile(mmap.mmap):
+    """mmap already reads/seeks like a file; zipfile also asks for these."""
+
+    def seekable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[BinaryIO]:
+    """Open *path* as a read-only memory map that parsers can read like a file.
+
+    Pages are loaded on demand instead of copying the whole document up
+    front. Empty files cannot be mapped and fall back to the plain handle.
+    """
+    with open(path, "rb") as handle:
+        try:
+            mapped = _MappedFile(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield handle
+            return
+        with mapped:
+            yield mapped
+
+
 def _read_xlsx(path: Path) -> str:
     try:
         import pandas as pd
@@ -67,7 +96,8 @@ def _read_xlsx(path: Path) -> str:
         return ""
 
     try:
-        df = pd.read_excel(path)
+        with _mapped(path) as data:
+            df = pd.read_excel(data)
         text_content = []
         for col in df.columns:
             text_content.append(str(col))
@@ -85,7 +115,8 @@ def _read_docx(path: Path) -> str:
         print(f"Warning: Skipping '{path.name}' - python-docx library is not installed.")
         return ""
 
-    doc = Document(path)
+    with _mapped(path) as data:
+        doc = Document(data)
     return "\n".join(p.text for p in doc.paragraphs)
 
 
@@ -96,6 +127,8 @@ def _read_pdf(path: Path) -> str:
         print(f"Warning: Skipping '{path.name}' - pdfminer.six library is not installed.")
         return ""
 
+    # pdfminer reads through its own seekable file handle, so the path is
+    # passed as-is rather than a mapping it would not accept
     return extract_text(str(path)) or ""
 
 
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+class LLMCache:
+    """On-disk cache of LLM responses, keyed by sha256 of the exact request.
+
+    Entries are plain UTF-8 files named after the key, so the cache can be
+    inspected or cleared by hand. The directory defaults to
+    ``~/.testgenai/llm_cache`` and can be moved with TESTGEN_LLM_CACHE_DIR.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        if cache_dir is None:
+            cache_dir = os.environ.get("TESTGEN_LLM_CACHE_DIR") or Path.home() / ".testgenai" / "llm_cache"
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def make_key(url: str, prompt: str) -> str:
+        payload = json.dumps({"url": url, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, url: str, prompt: str) -> Optional[str]:
+        path = self.cache_dir / f"{self.make_key(url, prompt)}.txt"
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def set(self, url: str, prompt: str, response: str) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{self.make_key(url, prompt)}.txt"
+        # Write then rename so a concurrent reader never sees a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(response)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
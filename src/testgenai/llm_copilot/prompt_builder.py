@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
 
 def build_prompt(
@@ -10,14 +11,60 @@ def build_prompt(
     template_schema: Dict[str, Any] | None = None,
     code_context: str = "",
 ) -> str:
+    static_prefix, dynamic_suffix = build_prompt_parts(
+        requirements, signals, user_prompt, template_schema, code_context
+    )
+    return f"{static_prefix}\n{dynamic_suffix}"
+
+
+def build_prompt_parts(
+    requirements: List[Any],
+    signals: List[Any],
+    user_prompt: str,
+    template_schema: Dict[str, Any] | None = None,
+    code_context: str = "",
+) -> Tuple[str, str]:
+    """Build the prompt as (static_prefix, dynamic_suffix).
+
+    The prefix (persona, task, template hint and rules) only depends on the
+    template columns, so it is identical across runs over the same template
+    and backends with prefix caching can reuse it. Everything that changes
+    per run (requirements, signals, code context, user prompt) goes last.
+    """
+    columns: Tuple[str, ...] = ()
+    if template_schema and template_schema.get("columns"):
+        columns = tuple(template_schema["columns"])
+
     req_lines = [
         f"- **{_get_value(r, 'req_id')}**: {_get_value(r, 'description')}" for r in requirements
     ]
     sig_lines = [_get_value(s, "name") for s in signals]
 
+    signals_hint = ""
+    if sig_lines:
+        signals_hint = f"Available A2L signals (sample): {', '.join(sig_lines[:30])}"
+
+    code_hint = ""
+    if code_context:
+        code_hint = f"Code-derived constraints/functions:\n{code_context[:4000]}"
+
+    dynamic = [
+        "\n---",
+        "## REQUIREMENTS:",
+        "\n".join(req_lines),
+        signals_hint,
+        code_hint,
+        user_prompt,
+    ]
+
+    return _static_prefix(columns), "\n".join([p for p in dynamic if p])
+
+
+@lru_cache(maxsize=32)
+def _static_prefix(columns: Tuple[str, ...]) -> str:
     persona = (
         "You are a Senior Automotive Test Engineer with 20 years of experience in ISO 26262 Functional Safety. "
-        "Your job is to write incredibly detailed, high-coverage test cases for the following requirements."
+        "Your job is to write incredibly detailed, high-coverage test cases for the requirements listed below."
     )
 
     task = (
@@ -32,41 +79,58 @@ def build_prompt(
     )
 
     template_hint = ""
-    if template_schema and template_schema.get("columns"):
+    if columns:
         template_hint = (
             "The STP Excel template was analyzed. Use naming aligned to these columns: "
-            f"{', '.join(template_schema['columns'])}."
+            f"{', '.join(columns)}."
         )
 
-    signals_hint = ""
-    if sig_lines:
-        signals_hint = f"Available A2L signals (sample): {', '.join(sig_lines[:30])}"
-
-    code_hint = ""
-    if code_context:
-        code_hint = f"Code-derived constraints/functions:\n{code_context[:4000]}"
-
-    full_prompt = [
+    static = [
         persona,
         "\n---",
-        "## REQUIREMENTS:",
-        "\n".join(req_lines),
-        "\n---",
         "## INSTRUCTIONS:",
         task,
         template_hint,
-        signals_hint,
-        code_hint,
         "## RULES:",
         "- 'Steps' and 'Expected Results' must be numbered lists (1. 2. 3.).",
         "- 'Preconditions' should be specific (e.g. 'Ignition ON', 'Speed > 100km/h').",
         "- 'Test ID' should be unique (e.g. TC-001, TC-002).",
         "- strictly map 'Requirement IDs' to the input list.",
         "- Do not include chatter or explanations. Just the table.",
-        user_prompt,
     ]
 
-    return "\n".join([p for p in full_prompt if p])
+    return "\n".join([p for p in static if p])
+
+
+def pack_requirements(
+    requirements: Sequence[Any],
+    token_budget: int = 6000,
+    max_items: int = 20,
+) -> List[List[Any]]:
+    """Split requirements into prompt batches bounded by estimated tokens and count.
+
+    Batches are filled in input order, so the batches (and their cached
+    responses) stay stable while the requirements do. A requirement larger
+    than the budget gets a batch of its own.
+    """
+    batches: List[List[Any]] = []
+    current: List[Any] = []
+    used = 0
+    for req in requirements:
+        tokens = _estimate_tokens(req)
+        if current and (used + tokens > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], 0
+        current.append(req)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _estimate_tokens(req: Any) -> int:
+    # ~4 characters per token, plus the ID and list markup of its prompt line
+    return len(_get_value(req, "description")) // 4 + 20
 
 
 def _get_value(item: Any, key: str) -> str:
@@ -9,8 +9,14 @@ from testgenai.models.requirement import Requirement
 def build_trace_matrix(
     requirements: List[Requirement], tests: List[TestCase]
 ) -> Dict[str, List[str]]:
-    matrix = {r.req_id: [] for r in requirements}
+    matrix: Dict[str, List[str]] = {r.req_id: [] for r in requirements}
+    get = matrix.get
     for tc in tests:
+        test_id = tc.test_id
         for req_id in tc.requirements:
-            matrix.setdefault(req_id, []).append(tc.test_id)
+            # get() instead of setdefault(), which builds a throwaway list per call
+            ids = get(req_id)
+            if ids is None:
+                ids = matrix[req_id] = []
+            ids.append(test_id)
     return matrix
@@ -1,8 +1,9 @@
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Requirement:
     req_id: str
     title: str
@@ -10,3 +11,13 @@ class Requirement:
     req_type: str
     priority: Optional[str] = None
     tags: Optional[List[str]] = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "Requirement":
+        """Build from a doc_parser requirement dict.
+
+        Arguments are passed positionally (keyword parsing roughly doubles
+        construction cost) and the ID is interned, as it is shared by every
+        test case and trace-matrix entry that references it.
+        """
+        return cls(sys.intern(row["req_id"]), row["title"], row["description"], row.get("req_type", "functional"))
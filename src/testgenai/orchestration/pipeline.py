@@ -1,3 +1,5 @@
+import re
+import sys
 from pathlib import Path
 
 from testgenai.a2l.a2l_parser import load_a2l_signals
@@ -35,15 +37,7 @@ def run_pipeline(config_path: str) -> None:
         input_cfg.get("requirements_file", ""),
         additional_paths=[*requirement_sources, *code_sources],
     )
-    requirements = [
-        Requirement(
-            req_id=r["req_id"],
-            title=r["title"],
-            description=r["description"],
-            req_type=r.get("req_type", "functional"),
-        )
-        for r in req_dicts
-    ]
+    requirements = [Requirement.from_row(r) for r in req_dicts]
 
     srs = load_srs(input_cfg.get("srs_file", ""))
     _ = srs
@@ -107,10 +101,12 @@ def run_pipeline(config_path: str) -> None:
 
 
 
-def _rows_to_tests(rows: list[dict]) -> list[TestCase]:
+def _rows_to_tests(rows: list[dict], renumber: bool = False) -> list[TestCase]:
+    # Rows merged from several responses repeat the model's own IDs (each
+    # answer starts again at TC-001), so they are renumbered across the set
     tests: list[TestCase] = []
     for idx, row in enumerate(rows, start=1):
-        reqs = [r.strip() for r in row.get("requirements", "").split(",") if r.strip()]
+        reqs = [sys.intern(r.strip()) for r in row.get("requirements", "").split(",") if r.strip()]
         step = TestStep(
             step_id=f"LLM-STEP-{idx}",
             action=row.get("steps", ""),
@@ -119,7 +115,7 @@ def _rows_to_tests(rows: list[dict]) -> list[TestCase]:
         )
         tests.append(
             TestCase(
-                test_id=row.get("test_id", f"LLM-TC-{idx}"),
+                test_id=f"LLM-TC-{idx}" if renumber else row.get("test_id", f"LLM-TC-{idx}"),
                 title=row.get("title", "LLM Test"),
                 preconditions=row.get("preconditions", ""),
                 steps=[step],
@@ -127,3 +123,32 @@ def _rows_to_tests(rows: list[dict]) -> list[TestCase]:
             )
         )
     return tests
+
+
+# Copilot echoes requirement IDs loosely ("req-001", "REQ-001 *", " REQ-001")
+_REQ_ID_NOISE_RE = re.compile(r"[\s*]+")
+
+
+def _req_id_key(req_id: str) -> str:
+    return _REQ_ID_NOISE_RE.sub("", req_id).upper()
+
+
+def _link_ai_requirements(tests: list[TestCase], requirements: list[Requirement]) -> list[Requirement]:
+    """Point AI test requirement IDs at the loaded requirements.
+
+    IDs that match a requirement ignoring case, whitespace and '*' markers are
+    rewritten to its exact ID so the trace matrix links them. Returns the
+    requirements that no test references.
+    """
+    canonical = {_req_id_key(r.req_id): r.req_id for r in requirements}
+
+    def link(ids: list[str]) -> list[str]:
+        return [canonical.get(_req_id_key(req_id), req_id) for req_id in ids]
+
+    covered: set[str] = set()
+    for tc in tests:
+        tc.requirements = link(tc.requirements)
+        for step in tc.steps:
+            step.requirement_ids = link(step.requirement_ids)
+        covered.update(tc.requirements)
+    return [r for r in requirements if r.req_id not in covered]
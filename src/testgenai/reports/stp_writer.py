@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from copy import copy
+from os import PathLike
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import BinaryIO, Dict, Iterable, List, Tuple, Union
 
 import openpyxl
 
@@ -19,15 +20,34 @@ _FIELD_KEYWORDS = {
     "requirements": ["requirement", "req id", "traceability", "ref"],
 }
 
+# Column order used when there is no template to take headers from
+_DEFAULT_HEADERS = [
+    ("test_id", "Test ID"),
+    ("title", "Title"),
+    ("description", "Description"),
+    ("preconditions", "Preconditions"),
+    ("steps", "Steps"),
+    ("expected", "Expected Results"),
+    ("requirements", "Requirement IDs"),
+]
+
 
 def write_stp_output(
-    template_path: str,
+    template_path: Union[str, PathLike, BinaryIO],
     output_path: str,
-    tests: List[TestCase],
+    tests: Iterable[TestCase],
     trace_matrix: Dict[str, List[str]],
     trace_sheet_name: str,
 ) -> None:
-    if not template_path or not Path(template_path).exists():
+    """Write the test plan; *tests* is consumed once, in order, so it may be a generator.
+
+    The template may be a path or an open binary file (e.g. a BytesIO of
+    template bytes the caller already holds).
+    """
+    if not template_path:
+        _write_plain_output(output_path, tests, trace_matrix, trace_sheet_name)
+        return
+    if isinstance(template_path, (str, PathLike)) and not Path(template_path).exists():
         raise FileNotFoundError(f"Template file not found: {template_path}")
 
     wb = openpyxl.load_workbook(template_path)
@@ -44,6 +64,32 @@ def write_stp_output(
     wb.save(output)
 
 
+def _write_plain_output(
+    output_path: str,
+    tests: Iterable[TestCase],
+    trace_matrix: Dict[str, List[str]],
+    trace_sheet_name: str,
+) -> None:
+    """Write an unstyled plan with default headers, streaming rows in write-only mode."""
+    wb = openpyxl.Workbook(write_only=True)
+
+    sheet = wb.create_sheet("Test Plan")
+    sheet.append([header for _, header in _DEFAULT_HEADERS])
+    for test in tests:
+        values = _test_values(test)
+        sheet.append([values[field] for field, _ in _DEFAULT_HEADERS])
+
+    if trace_sheet_name:
+        trace_sheet = wb.create_sheet(trace_sheet_name)
+        trace_sheet.append(["Requirement ID", "Test Cases"])
+        for req, req_tests in trace_matrix.items():
+            trace_sheet.append([req, ", ".join(req_tests)])
+
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(output)
+
+
 def _find_test_sheet(workbook: openpyxl.Workbook) -> Tuple[openpyxl.worksheet.worksheet.Worksheet, int, Dict[str, int]]:
     for sheet_name in workbook.sheetnames:
         sheet = workbook[sheet_name]
@@ -72,42 +118,42 @@ def _build_header_map(row_values: List[str]) -> Dict[str, int]:
     return header_map
 
 
-def _fill_test_sheet(sheet, tests: List[TestCase], header_row: int, header_map: Dict[str, int]) -> None:
+def _fill_test_sheet(sheet, tests: Iterable[TestCase], header_row: int, header_map: Dict[str, int]) -> None:
     if not header_map:
-        header_map = {
-            "test_id": 1,
-            "title": 2,
-            "description": 3,
-            "preconditions": 4,
-            "steps": 5,
-            "expected": 6,
-            "requirements": 7,
-        }
+        header_map = {field: col for col, (field, _) in enumerate(_DEFAULT_HEADERS, 1)}
 
     start_row = header_row + 1
     _clear_existing_rows(sheet, start_row, header_map)
 
     template_style_row = _resolve_style_row(sheet, start_row)
+    # Template styles are looked up once per column, not once per written cell
+    columns = [
+        (field, col, sheet.cell(row=template_style_row, column=col)) for field, col in header_map.items()
+    ]
 
     for offset, test in enumerate(tests):
         row = start_row + offset
-        steps_text = "\n".join(f"{i + 1}. {s.action}" for i, s in enumerate(test.steps))
-        expected_text = "\n".join(f"{i + 1}. {s.expected}" for i, s in enumerate(test.steps))
-
-        values = {
-            "test_id": test.test_id,
-            "title": test.title,
-            "description": test.title,
-            "preconditions": test.preconditions,
-            "steps": steps_text,
-            "expected": expected_text,
-            "requirements": ", ".join(test.requirements),
-        }
-
-        for field, col in header_map.items():
+        values = _test_values(test)
+
+        for field, col, src in columns:
             cell = sheet.cell(row=row, column=col)
             cell.value = values.get(field, "")
-            _copy_cell_style(sheet, template_style_row, row, col)
+            _copy_cell_style(src, cell)
+
+
+def _test_values(test: TestCase) -> Dict[str, str]:
+    steps_text = "\n".join(f"{i + 1}. {s.action}" for i, s in enumerate(test.steps))
+    expected_text = "\n".join(f"{i + 1}. {s.expected}" for i, s in enumerate(test.steps))
+
+    return {
+        "test_id": test.test_id,
+        "title": test.title,
+        "description": test.title,
+        "preconditions": test.preconditions,
+        "steps": steps_text,
+        "expected": expected_text,
+        "requirements": ", ".join(test.requirements),
+    }
 
 
 def _clear_existing_rows(sheet, start_row: int, header_map: Dict[str, int]) -> None:
@@ -125,11 +171,11 @@ def _resolve_style_row(sheet, start_row: int) -> int:
     return max(start_row - 1, 1)
 
 
-def _copy_cell_style(sheet, src_row: int, dst_row: int, col: int) -> None:
-    src = sheet.cell(row=src_row, column=col)
-    dst = sheet.cell(row=dst_row, column=col)
+def _copy_cell_style(src, dst) -> None:
     if src.has_style:
+        # The style array already carries the number format and alignment
         dst._style = copy(src._style)
+        return
     if src.number_format:
         dst.number_format = src.number_format
     if src.alignment:
@@ -6,15 +6,25 @@ Production-grade generator for ASIL-A compliant automotive test cases
 import json
 import logging
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+# Optional C-speed JSON serializer; the stdlib encoder is used when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import (
     WIFRequirement,
     WIFTestCase,
@@ -28,6 +38,58 @@ from .models import (
     ValidationError,
 )
 from .validators import TestCaseValidator
+from .xlsx_stream import StreamingSheet, StreamingWorkbook, StyledValue
+
+
+# Shared openpyxl styles - built once at import instead of per cell
+_TITLE_FONT = Font(size=20, bold=True, color="FFFFFF")
+_TITLE_FILL = PatternFill(start_color="2C3E50", end_color="2C3E50", fill_type="solid")
+_LABEL_FONT = Font(size=12, bold=True)
+_PLAIN_FONT = Font()
+_SUMMARY_TITLE_FONT = Font(bold=True, size=14)
+_BOLD_RED_FONT = Font(bold=True, color="FF0000")
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="34495E", end_color="34495E", fill_type="solid")
+_COVERED_FILL = PatternFill(start_color="27AE60", end_color="27AE60", fill_type="solid")
+_UNCOVERED_FILL = PatternFill(start_color="E74C3C", end_color="E74C3C", fill_type="solid")
+_UNCOVERED_LIGHT_FILL = PatternFill(start_color="FADBD8", end_color="FADBD8", fill_type="solid")
+_CENTER = Alignment(horizontal='center')
+_CENTER_MIDDLE = Alignment(horizontal='center', vertical='center')
+
+# Regex patterns used while building test cases
+_REQ_NUM_RE = re.compile(r'WIF_(\d{3})')
+_DIGITS_RE = re.compile(r'\d+')
+_OHM_THRESHOLD_RE = re.compile(r'(\d+)\s*(?:ohm|ω|Ω)', re.IGNORECASE)
+_MEASURED_VALUE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(ohm|ms|s|v|ma|%|ω|Ω)?', re.IGNORECASE)
+
+
+# Requirement types bound once - Enum member lookup costs far more than
+# the identity check it feeds in the per-test-case paths
+_SYSTEM = RequirementType.SYSTEM
+_SOFTWARE = RequirementType.SOFTWARE
+_DIAGNOSTIC = RequirementType.DIAGNOSTIC
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for values it does not serialize natively"""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _styled_cell(ws, value: Any, font: Optional[Font] = None, fill: Optional[PatternFill] = None,
+                 alignment: Optional[Alignment] = None) -> Union[WriteOnlyCell, StyledValue]:
+    """Build a styled cell for appending to a write-only worksheet"""
+    if isinstance(ws, StreamingSheet):
+        return ws.styled(value, font, fill, alignment)
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
 
 
 class WIFTestCaseGenerator:
@@ -64,6 +126,10 @@ class WIFTestCaseGenerator:
     DIAGNOSTIC_SHEET = "Diagnostic Requirements"
     CALIBRATION_SHEET = "Calibration Parameters"
     
+    # Above this many requirements the traceability matrix bypasses openpyxl
+    # and is emitted as raw SpreadsheetML
+    STREAMING_XLSX_THRESHOLD = 10000
+    
     def __init__(self, requirements_file: str, output_dir: str = "output"):
         """
         Initialize the generator with requirements file
@@ -81,10 +147,19 @@ class WIFTestCaseGenerator:
         
         # Data stores
         self.requirements: Dict[str, WIFRequirement] = {}
+        # Loaded requirements indexed by type - maintained as each row is stored
+        self._reqs_by_type: Dict[RequirementType, List[WIFRequirement]] = {t: [] for t in RequirementType}
         self.test_cases: List[WIFTestCase] = []
         self.a2l_parameters: Set[str] = set()
         self.errors: List[str] = []
         
+        # Generated test cases indexed by type and by requirement - maintained
+        # as each TC is emitted
+        self._tcs_by_type: Dict[RequirementType, List[WIFTestCase]] = {t: [] for t in RequirementType}
+        self._tcs_by_req: Dict[str, List[WIFTestCase]] = {}
+        # Set when a duplicate ID replaced an earlier row during loading
+        self._order_stale = False
+        
         # Counters for ID generation
         self._sys_counter: Dict[str, int] = {}
         self._sw_counter: Dict[str, int] = {}
@@ -92,11 +167,12 @@ class WIFTestCaseGenerator:
         
         # Validation
         self.validator: Optional[TestCaseValidator] = None
+        self.coverage_report: Optional[CoverageReport] = None
         
         self.logger.info("=" * 70)
         self.logger.info("WIF ECM Test Case Generator Initialized")
-        self.logger.info(f"Requirements file: {requirements_file}")
-        self.logger.info(f"Output directory: {output_dir}")
+        self.logger.info("Requirements file: %s", requirements_file)
+        self.logger.info("Output directory: %s", output_dir)
         self.logger.info("=" * 70)
     
     def _setup_logging(self) -> logging.Logger:
@@ -126,8 +202,15 @@ class WIFTestCaseGenerator:
         
         return logger
     
-    def _load_requirements(self) -> None:
-        """Load all requirements from Excel file with multiple sheets"""
+    def _load_requirements(self, on_requirement: Optional[Callable[[WIFRequirement], Any]] = None) -> None:
+        """
+        Load all requirements from Excel file with multiple sheets
+        
+        Args:
+            on_requirement: Optional callback invoked with each requirement as
+                soon as its row is parsed (used to generate test cases in the
+                same pass as loading)
+        """
         self.logger.info("Loading requirements from Excel...")
         
         if not self.requirements_file.exists():
@@ -137,35 +220,39 @@ class WIFTestCaseGenerator:
             # Load all sheets
             xl = pd.ExcelFile(self.requirements_file)
             available_sheets = xl.sheet_names
-            self.logger.info(f"Available sheets: {available_sheets}")
+            self.logger.info("Available sheets: %s", available_sheets)
             
             # Process each requirement type
             if self.SYSTEM_SHEET in available_sheets:
-                self._load_sheet(xl, self.SYSTEM_SHEET, RequirementType.SYSTEM)
+                self._load_sheet(xl, self.SYSTEM_SHEET, RequirementType.SYSTEM, on_requirement)
             else:
-                self.logger.warning(f"Sheet '{self.SYSTEM_SHEET}' not found")
+                self.logger.warning("Sheet '%s' not found", self.SYSTEM_SHEET)
             
             if self.SOFTWARE_SHEET in available_sheets:
-                self._load_sheet(xl, self.SOFTWARE_SHEET, RequirementType.SOFTWARE)
+                self._load_sheet(xl, self.SOFTWARE_SHEET, RequirementType.SOFTWARE, on_requirement)
             else:
-                self.logger.warning(f"Sheet '{self.SOFTWARE_SHEET}' not found")
+                self.logger.warning("Sheet '%s' not found", self.SOFTWARE_SHEET)
             
             if self.DIAGNOSTIC_SHEET in available_sheets:
-                self._load_sheet(xl, self.DIAGNOSTIC_SHEET, RequirementType.DIAGNOSTIC)
+                self._load_sheet(xl, self.DIAGNOSTIC_SHEET, RequirementType.DIAGNOSTIC, on_requirement)
             else:
-                self.logger.warning(f"Sheet '{self.DIAGNOSTIC_SHEET}' not found")
+                self.logger.warning("Sheet '%s' not found", self.DIAGNOSTIC_SHEET)
             
             # Load A2L parameters if available
             if self.CALIBRATION_SHEET in available_sheets:
                 self._load_calibration_params(xl)
             
-            self.logger.info(f"Total requirements loaded: {len(self.requirements)}")
+            if self._order_stale:
+                self._restore_load_order()
+            
+            self.logger.info("Total requirements loaded: %d", len(self.requirements))
             
         except Exception as e:
-            self.logger.error(f"Failed to load requirements: {e}")
+            self.logger.error("Failed to load requirements: %s", e)
             raise
     
-    def _load_sheet(self, xl: pd.ExcelFile, sheet_name: str, req_type: RequirementType) -> None:
+    def _load_sheet(self, xl: pd.ExcelFile, sheet_name: str, req_type: RequirementType,
+                    on_requirement: Optional[Callable[[WIFRequirement], Any]] = None) -> None:
         """Load requirements from a specific sheet"""
         df = pd.read_excel(xl, sheet_name=sheet_name)
         
@@ -181,23 +268,31 @@ class WIFTestCaseGenerator:
         cal_col = self._find_column(df, ['calibration_params', 'calibration', 'a2l_params', 'cal params'])
         
         if id_col is None or desc_col is None:
-            self.logger.warning(f"Sheet '{sheet_name}' missing required columns (ID or Description)")
+            self.logger.warning("Sheet '%s' missing required columns (ID or Description)", sheet_name)
             return
         
         count = 0
         for _, row in df.iterrows():
-            req_id = str(row[id_col]).strip() if pd.notna(row[id_col]) else ""
+            # IDs and A2L names are interned: they are hashed and compared in
+            # every index and validation pass, and must not change after load
+            req_id = sys.intern(str(row[id_col]).strip()) if pd.notna(row[id_col]) else ""
             description = str(row[desc_col]).strip() if pd.notna(row[desc_col]) else ""
             
             if not req_id or not description:
                 continue
             
+            # A repeated ID replaces the earlier row (last one wins)
+            if req_id in self.requirements:
+                self.logger.warning("Duplicate requirement '%s' in '%s' - replacing earlier row",
+                                    req_id, sheet_name)
+                self._drop_requirement(self.requirements[req_id])
+            
             # Parse ASIL level
             asil_str = str(row[asil_col]).strip() if asil_col and pd.notna(row.get(asil_col)) else "QM"
             asil = self._parse_asil(asil_str)
             
             # Parse parent reference
-            parent = str(row[parent_col]).strip() if parent_col and pd.notna(row.get(parent_col)) else None
+            parent = sys.intern(str(row[parent_col]).strip()) if parent_col and pd.notna(row.get(parent_col)) else None
             
             # Parse DTC code
             dtc = str(row[dtc_col]).strip() if dtc_col and pd.notna(row.get(dtc_col)) else None
@@ -206,7 +301,7 @@ class WIFTestCaseGenerator:
             cal_params = []
             if cal_col and pd.notna(row.get(cal_col)):
                 cal_str = str(row[cal_col])
-                cal_params = [p.strip() for p in cal_str.split(',') if p.strip()]
+                cal_params = [sys.intern(p.strip()) for p in cal_str.split(',') if p.strip()]
             
             req = WIFRequirement(
                 req_id=req_id,
@@ -220,9 +315,44 @@ class WIFTestCaseGenerator:
             )
             
             self.requirements[req_id] = req
+            self._reqs_by_type[req_type].append(req)
             count += 1
+            
+            if on_requirement is not None:
+                on_requirement(req)
         
-        self.logger.info(f"Loaded {count} requirements from '{sheet_name}'")
+        self.logger.info("Loaded %d requirements from '%s'", count, sheet_name)
+    
+    def _drop_requirement(self, req: WIFRequirement) -> None:
+        """Remove a superseded requirement and any test cases already emitted for it"""
+        self._reqs_by_type[req.req_type].remove(req)
+        self._order_stale = True
+        stale = self._tcs_by_req.pop(req.req_id, None)
+        if not stale:
+            return
+        stale_ids = {id(tc) for tc in stale}
+        self.test_cases = [tc for tc in self.test_cases if id(tc) not in stale_ids]
+        tcs = self._tcs_by_type[req.req_type]
+        tcs[:] = [tc for tc in tcs if id(tc) not in stale_ids]
+        # The replacement's test case numbering starts again at _001
+        for counter in (self._sys_counter, self._sw_counter, self._diag_counter):
+            counter.pop(req.req_id, None)
+    
+    def _restore_load_order(self) -> None:
+        """
+        Re-sort the indexes after duplicate IDs were replaced
+        
+        A replacement row is appended when it is read, but a requirement
+        keeps the position of its first row in self.requirements. Rebuilding
+        the per-type lists in that order gives the same requirement and test
+        case order as loading first and then running the generate_* passes.
+        """
+        for req_type in RequirementType:
+            reqs = [r for r in self.requirements.values() if r.req_type is req_type]
+            self._reqs_by_type[req_type] = reqs
+            self._tcs_by_type[req_type] = [tc for r in reqs for tc in self._tcs_by_req.get(r.req_id, ())]
+        self.test_cases = [tc for req_type in RequirementType for tc in self._tcs_by_type[req_type]]
+        self._order_stale = False
     
     def _find_column(self, df: pd.DataFrame, candidates: List[str]) -> Optional[str]:
         """Find column name from a list of candidates"""
@@ -257,26 +387,22 @@ class WIFTestCaseGenerator:
             param_col = self._find_column(df, ['parameter', 'param_name', 'name', 'a2l_name'])
             if param_col:
                 for val in df[param_col].dropna():
-                    self.a2l_parameters.add(str(val).strip())
+                    self.a2l_parameters.add(sys.intern(str(val).strip()))
             
-            self.logger.info(f"Loaded {len(self.a2l_parameters)} calibration parameters")
+            self.logger.info("Loaded %d calibration parameters", len(self.a2l_parameters))
         except Exception as e:
-            self.logger.warning(f"Could not load calibration parameters: {e}")
+            self.logger.warning("Could not load calibration parameters: %s", e)
     
     def generate_system_test_cases(self) -> List[WIFTestCase]:
         """Generate test cases from System Requirements"""
         self.logger.info("Generating System Test Cases...")
         
         system_tests = []
-        system_reqs = {k: v for k, v in self.requirements.items() 
-                       if v.req_type == RequirementType.SYSTEM}
-        
-        for req_id, req in system_reqs.items():
-            test_case = self._create_test_case(req, RequirementType.SYSTEM)
+        for req in self._reqs_by_type[RequirementType.SYSTEM]:
+            test_case = self._emit_test_case(req)
             system_tests.append(test_case)
-            self.test_cases.append(test_case)
         
-        self.logger.info(f"Generated {len(system_tests)} System Test Cases")
+        self.logger.info("Generated %d System Test Cases", len(system_tests))
         return system_tests
     
     def generate_software_test_cases(self) -> List[WIFTestCase]:
@@ -284,15 +410,11 @@ class WIFTestCaseGenerator:
         self.logger.info("Generating Software Test Cases...")
         
         software_tests = []
-        software_reqs = {k: v for k, v in self.requirements.items() 
-                         if v.req_type == RequirementType.SOFTWARE}
-        
-        for req_id, req in software_reqs.items():
-            test_case = self._create_test_case(req, RequirementType.SOFTWARE)
+        for req in self._reqs_by_type[RequirementType.SOFTWARE]:
+            test_case = self._emit_test_case(req)
             software_tests.append(test_case)
-            self.test_cases.append(test_case)
         
-        self.logger.info(f"Generated {len(software_tests)} Software Test Cases")
+        self.logger.info("Generated %d Software Test Cases", len(software_tests))
         return software_tests
     
     def generate_diagnostic_test_cases(self) -> List[WIFTestCase]:
@@ -300,17 +422,23 @@ class WIFTestCaseGenerator:
         self.logger.info("Generating Diagnostic Test Cases...")
         
         diagnostic_tests = []
-        diagnostic_reqs = {k: v for k, v in self.requirements.items() 
-                           if v.req_type == RequirementType.DIAGNOSTIC}
-        
-        for req_id, req in diagnostic_reqs.items():
-            test_case = self._create_test_case(req, RequirementType.DIAGNOSTIC)
+        for req in self._reqs_by_type[RequirementType.DIAGNOSTIC]:
+            test_case = self._emit_test_case(req)
             diagnostic_tests.append(test_case)
-            self.test_cases.append(test_case)
         
-        self.logger.info(f"Generated {len(diagnostic_tests)} Diagnostic Test Cases")
+        self.logger.info("Generated %d Diagnostic Test Cases", len(diagnostic_tests))
         return diagnostic_tests
     
+    def _emit_test_case(self, req: WIFRequirement) -> WIFTestCase:
+        """Create a test case for a requirement and record it in the indexes"""
+        test_case = self._create_test_case(req, req.req_type)
+        self.test_cases.append(test_case)
+        self._tcs_by_type[req.req_type].append(test_case)
+        self._tcs_by_req.setdefault(req.req_id, []).append(test_case)
+        # Any earlier coverage report no longer reflects the test cases
+        self.coverage_report = None
+        return test_case
+    
     def _create_test_case(self, req: WIFRequirement, tc_type: RequirementType) -> WIFTestCase:
         """Create a test case from a requirement"""
         # Generate test case ID
@@ -344,7 +472,7 @@ class WIFTestCaseGenerator:
         )
         
         # Add DTC-specific preconditions for diagnostic tests
-        if tc_type == RequirementType.DIAGNOSTIC:
+        if tc_type is _DIAGNOSTIC:
             tc.preconditions.append("Extended diagnostic session 0x10 0x03 active")
             tc.preconditions.append("No pending DTCs")
         
@@ -353,19 +481,19 @@ class WIFTestCaseGenerator:
     def _generate_test_case_id(self, req_id: str, tc_type: RequirementType) -> str:
         """Generate strict-format test case ID"""
         # Extract requirement number
-        match = re.search(r'WIF_(\d{3})', req_id)
+        match = _REQ_NUM_RE.search(req_id)
         if match:
             req_num = match.group(1)
         else:
             # Fallback: extract any number sequence
-            nums = re.findall(r'\d+', req_id)
+            nums = _DIGITS_RE.findall(req_id)
             req_num = nums[0].zfill(3) if nums else "001"
         
         # Generate sequence number
-        if tc_type == RequirementType.SYSTEM:
+        if tc_type is _SYSTEM:
             counter = self._sys_counter
             prefix = "TC_SYS_SYS_WIF"
-        elif tc_type == RequirementType.SOFTWARE:
+        elif tc_type is _SOFTWARE:
             counter = self._sw_counter
             prefix = "TC_SW_SW_WIF"
         else:
@@ -399,7 +527,7 @@ class WIFTestCaseGenerator:
         # Water detection requirements
         if 'water' in desc and 'resistance' in desc:
             # Extract threshold value if present
-            threshold_match = re.search(r'(\d+)\s*(?:ohm|ω|Ω)', desc, re.IGNORECASE)
+            threshold_match = _OHM_THRESHOLD_RE.search(desc)
             threshold = threshold_match.group(1) if threshold_match else "1000"
             
             steps.append(WIFTestStep(
@@ -513,23 +641,24 @@ class WIFTestCaseGenerator:
     def _build_traceability(self, req: WIFRequirement) -> Traceability:
         """Build traceability block for a requirement"""
         trace = Traceability()
+        req_type = req.req_type
         
-        if req.req_type == RequirementType.SYSTEM:
+        if req_type is _SYSTEM:
             trace.system_req = req.req_id
-        elif req.req_type == RequirementType.SOFTWARE:
+        elif req_type is _SOFTWARE:
             trace.software_req = req.req_id
             # Add parent system req if exists
             if req.parent_system_req:
                 trace.system_req = req.parent_system_req
-        elif req.req_type == RequirementType.DIAGNOSTIC:
+        elif req_type is _DIAGNOSTIC:
             trace.diagnostic_req = req.req_id
         
         # Add A2L reference
         if req.calibration_params:
             trace.a2l_reference = req.calibration_params[0]
-        elif req.req_type == RequirementType.SYSTEM:
+        elif req_type is _SYSTEM:
             # Generate default A2L reference based on requirement
-            num = re.search(r'\d+', req.req_id)
+            num = _DIGITS_RE.search(req.req_id)
             if num:
                 trace.a2l_reference = f"CAL_WIF_Param_{num.group()}"
         
@@ -540,7 +669,7 @@ class WIFTestCaseGenerator:
         desc = req.description.lower()
         
         # Extract measurable values from description
-        numeric_match = re.search(r'(\d+(?:\.\d+)?)\s*(ohm|ms|s|v|ma|%|ω|Ω)?', desc, re.IGNORECASE)
+        numeric_match = _MEASURED_VALUE_RE.search(desc)
         
         if 'water' in desc and 'detect' in desc:
             return "WIF_Status flag = 1 when sensor resistance < threshold; DTC P242F stored within 200ms of detection"
@@ -568,21 +697,22 @@ class WIFTestCaseGenerator:
         
         report = self.validator.validate_coverage(self.test_cases)
         
-        self.logger.info(f"Total Requirements: {report.total_requirements}")
-        self.logger.info(f"Covered Requirements: {report.covered_requirements}")
-        self.logger.info(f"Total Test Cases: {report.total_test_cases}")
-        self.logger.info(f"  - System TCs: {report.system_test_cases}")
-        self.logger.info(f"  - Software TCs: {report.software_test_cases}")
-        self.logger.info(f"  - Diagnostic TCs: {report.diagnostic_test_cases}")
-        self.logger.info(f"Coverage: {report.coverage_percentage:.1f}%")
+        self.logger.info("Total Requirements: %d", report.total_requirements)
+        self.logger.info("Covered Requirements: %d", report.covered_requirements)
+        self.logger.info("Total Test Cases: %d", report.total_test_cases)
+        self.logger.info("  - System TCs: %d", report.system_test_cases)
+        self.logger.info("  - Software TCs: %d", report.software_test_cases)
+        self.logger.info("  - Diagnostic TCs: %d", report.diagnostic_test_cases)
+        self.logger.info("Coverage: %.1f%%", report.coverage_percentage)
         
         if not report.is_complete():
             self.logger.error("CRITICAL: 100% coverage NOT achieved!")
             for req_id in report.uncovered_requirements:
-                self.logger.error(f"  MISSING: {req_id}")
+                self.logger.error("  MISSING: %s", req_id)
         else:
             self.logger.info("✓ 100% COVERAGE ACHIEVED")
         
+        self.coverage_report = report
         return report
     
     def validate_all_test_cases(self) -> Tuple[bool, List[ValidationError]]:
@@ -601,7 +731,7 @@ class WIFTestCaseGenerator:
         if is_valid:
             self.logger.info("✓ All test cases passed validation")
         else:
-            self.logger.error(f"✗ {len(errors)} validation errors found")
+            self.logger.error("✗ %d validation errors found", len(errors))
         
         return is_valid, errors
     
@@ -613,58 +743,72 @@ class WIFTestCaseGenerator:
         
         output_files = {}
         
-        # Export JSON files by type
-        sys_tcs = [tc for tc in self.test_cases if tc.type == RequirementType.SYSTEM]
-        sw_tcs = [tc for tc in self.test_cases if tc.type == RequirementType.SOFTWARE]
-        diag_tcs = [tc for tc in self.test_cases if tc.type == RequirementType.DIAGNOSTIC]
-        
-        if sys_tcs:
-            path = self._export_json(sys_tcs, "WIF_System_TestCases.json")
-            output_files["system_json"] = path
-        
-        if sw_tcs:
-            path = self._export_json(sw_tcs, "WIF_Software_TestCases.json")
-            output_files["software_json"] = path
+        # JSON files by type
+        json_exports = [
+            ("system_json", self._tcs_by_type[RequirementType.SYSTEM], "WIF_System_TestCases.json"),
+            ("software_json", self._tcs_by_type[RequirementType.SOFTWARE], "WIF_Software_TestCases.json"),
+            ("diagnostic_json", self._tcs_by_type[RequirementType.DIAGNOSTIC], "WIF_Diagnostic_TestCases.json"),
+        ]
         
-        if diag_tcs:
-            path = self._export_json(diag_tcs, "WIF_Diagnostic_TestCases.json")
-            output_files["diagnostic_json"] = path
+        # Write the JSON files on worker threads so their disk I/O overlaps
+        # with building the traceability matrix on this thread
+        with ThreadPoolExecutor(max_workers=len(json_exports)) as pool:
+            json_jobs = [
+                (key, pool.submit(self._export_json, tcs, filename))
+                for key, tcs, filename in json_exports if tcs
+            ]
+            
+            # Export traceability matrix
+            matrix_path = self._export_traceability_matrix()
+            
+            for key, job in json_jobs:
+                output_files[key] = job.result()
         
-        # Export traceability matrix
-        matrix_path = self._export_traceability_matrix()
         output_files["traceability_matrix"] = matrix_path
         
-        self.logger.info(f"Exported {len(output_files)} files to {self.output_dir}")
+        self.logger.info("Exported %d files to %s", len(output_files), self.output_dir)
         return output_files
     
     def _export_json(self, test_cases: List[WIFTestCase], filename: str) -> Path:
         """Export test cases to JSON file"""
         output_path = self.output_dir / filename
         
-        data = [tc.to_dict() for tc in test_cases]
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        # Validate JSON is parseable
-        with open(output_path, 'r', encoding='utf-8') as f:
-            try:
-                json.load(f)
-                self.logger.info(f"✓ {filename} - Valid JSON ({len(test_cases)} test cases)")
-            except json.JSONDecodeError as e:
-                self.logger.error(f"✗ {filename} - Invalid JSON: {e}")
-        
+        # The encoders only emit well-formed JSON, so an encoder failure is the
+        # only thing worth reporting - no need to re-read the file afterwards
+        try:
+            if orjson is not None:
+                # orjson walks the dataclasses natively (field order matches
+                # to_dict), giving the same bytes as the to_dict + json.dump path
+                payload = orjson.dumps(test_cases, default=_json_default, option=orjson.OPT_INDENT_2)
+                with open(output_path, 'wb') as f:
+                    f.write(payload)
+            else:
+                data = [tc.to_dict() for tc in test_cases]
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            self.logger.error("✗ %s - Could not serialize JSON: %s", filename, e)
+            raise
+
+        self.logger.info("✓ %s - Written (%d test cases)", filename, len(test_cases))
+
         return output_path
     
     def _export_traceability_matrix(self) -> Path:
         """Export traceability matrix to Excel"""
         output_path = self.output_dir / "WIF_TestCases_Traceability_Matrix.xlsx"
         
-        wb = Workbook()
+        # Write-only mode streams each row to disk as it is appended instead
+        # of keeping every Cell in memory, so sheets must be written in order
+        # and column widths set before the first row. Very large matrices
+        # skip openpyxl's per-cell objects entirely.
+        if len(self.requirements) > self.STREAMING_XLSX_THRESHOLD:
+            wb = StreamingWorkbook()
+        else:
+            wb = Workbook(write_only=True)
         
         # Cover sheet
-        cover = wb.active
-        cover.title = "Cover"
+        cover = wb.create_sheet("Cover")
         self._create_cover_sheet(cover)
         
         # Test Cases sheet
@@ -676,23 +820,21 @@ class WIFTestCaseGenerator:
         self._create_summary_sheet(summary)
         
         wb.save(output_path)
-        self.logger.info(f"✓ Traceability Matrix exported: {output_path.name}")
+        self.logger.info("✓ Traceability Matrix exported: %s", output_path.name)
         
         return output_path
     
     def _create_cover_sheet(self, ws) -> None:
         """Create cover sheet with project info"""
-        # Styles
-        title_font = Font(size=20, bold=True, color="FFFFFF")
-        title_fill = PatternFill(start_color="2C3E50", end_color="2C3E50", fill_type="solid")
-        header_font = Font(size=12, bold=True)
+        ws.column_dimensions['A'].width = 25
+        ws.column_dimensions['B'].width = 40
         
         # Title
-        ws.merge_cells('A1:F3')
-        ws['A1'] = "WIF ECM Test Case Traceability Matrix"
-        ws['A1'].font = title_font
-        ws['A1'].fill = title_fill
-        ws['A1'].alignment = Alignment(horizontal='center', vertical='center')
+        ws.merged_cells.add('A1:F3')
+        ws.append([_styled_cell(ws, "WIF ECM Test Case Traceability Matrix",
+                                font=_TITLE_FONT, fill=_TITLE_FILL, alignment=_CENTER_MIDDLE)])
+        for _ in range(3):
+            ws.append([])
         
         # Project info
         info = [
@@ -704,83 +846,60 @@ class WIFTestCaseGenerator:
             ("Total Test Cases:", str(len(self.test_cases))),
         ]
         
-        for i, (label, value) in enumerate(info, start=5):
-            ws[f'A{i}'] = label
-            ws[f'A{i}'].font = header_font
-            ws[f'B{i}'] = value
-        
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 40
+        for label, value in info:
+            ws.append([_styled_cell(ws, label, font=_LABEL_FONT), value])
     
     def _create_test_cases_sheet(self, ws) -> None:
         """Create test cases traceability sheet"""
+        # Column widths
+        ws.column_dimensions['A'].width = 20
+        ws.column_dimensions['B'].width = 50
+        ws.column_dimensions['C'].width = 30
+        ws.column_dimensions['D'].width = 15
+        ws.column_dimensions['E'].width = 10
+        ws.column_dimensions['F'].width = 18
+        ws.column_dimensions['G'].width = 12
+        
         # Headers
         headers = [
             "Requirement ID", "Requirement Text", "Test Case ID", 
             "Coverage Status", "ASIL", "Verification Method", "Type"
         ]
+        ws.append([
+            _styled_cell(ws, header, font=_HEADER_FONT, fill=_HEADER_FILL, alignment=_CENTER)
+            for header in headers
+        ])
         
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="34495E", end_color="34495E", fill_type="solid")
-        
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
+        # Status cells are serialized as soon as a row is appended, so one
+        # styled cell per status can be shared by every row
+        covered_cell = _styled_cell(ws, "COVERED", fill=_COVERED_FILL)
+        uncovered_cell = _styled_cell(ws, "NOT COVERED", fill=_UNCOVERED_FILL)
         
         # Data rows
-        covered_reqs = {tc.requirement_id for tc in self.test_cases}
-        
-        row = 2
         for req_id, req in self.requirements.items():
             # Find test cases for this requirement
-            req_tcs = [tc for tc in self.test_cases if tc.requirement_id == req_id]
+            req_tcs = self._tcs_by_req.get(req_id)
+            req_text = req.description[:100]
             
             if req_tcs:
                 for tc in req_tcs:
-                    ws.cell(row=row, column=1, value=req_id)
-                    ws.cell(row=row, column=2, value=req.description[:100])
-                    ws.cell(row=row, column=3, value=tc.test_case_id)
-                    ws.cell(row=row, column=4, value="COVERED")
-                    ws.cell(row=row, column=4).fill = PatternFill(
-                        start_color="27AE60", end_color="27AE60", fill_type="solid"
-                    )
-                    ws.cell(row=row, column=5, value=tc.asil_level.value)
-                    ws.cell(row=row, column=6, value="Automated")
-                    ws.cell(row=row, column=7, value=tc.type.value)
-                    row += 1
+                    ws.append((req_id, req_text, tc.test_case_id, covered_cell,
+                               tc.asil_level.value, "Automated", tc.type.value))
             else:
-                ws.cell(row=row, column=1, value=req_id)
-                ws.cell(row=row, column=2, value=req.description[:100])
-                ws.cell(row=row, column=3, value="N/A")
-                ws.cell(row=row, column=4, value="NOT COVERED")
-                ws.cell(row=row, column=4).fill = PatternFill(
-                    start_color="E74C3C", end_color="E74C3C", fill_type="solid"
-                )
-                ws.cell(row=row, column=5, value=req.asil_level.value)
-                ws.cell(row=row, column=6, value="N/A")
-                ws.cell(row=row, column=7, value=req.req_type.value)
-                row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 50
-        ws.column_dimensions['C'].width = 30
-        ws.column_dimensions['D'].width = 15
-        ws.column_dimensions['E'].width = 10
-        ws.column_dimensions['F'].width = 18
-        ws.column_dimensions['G'].width = 12
+                ws.append((req_id, req_text, "N/A", uncovered_cell,
+                           req.asil_level.value, "N/A", req.req_type.value))
     
     def _create_summary_sheet(self, ws) -> None:
         """Create summary sheet with coverage metrics"""
-        header_font = Font(bold=True, size=12)
+        ws.column_dimensions['A'].width = 30
+        ws.column_dimensions['B'].width = 20
         
         # Coverage summary
-        ws['A1'] = "COVERAGE SUMMARY"
-        ws['A1'].font = Font(bold=True, size=14)
+        ws.append([_styled_cell(ws, "COVERAGE SUMMARY", font=_SUMMARY_TITLE_FONT)])
+        ws.append([])
         
-        coverage_report = self.validate_coverage()
+        # Reuse the report from run() rather than validating coverage twice
+        coverage_report = self.coverage_report or self.validate_coverage()
         
         metrics = [
             ("Total Requirements:", coverage_report.total_requirements),
@@ -797,37 +916,26 @@ class WIFTestCaseGenerator:
             ("ASIL Compliance:", "ASIL-A" if coverage_report.is_complete() else "INCOMPLETE"),
         ]
         
-        for i, (label, value) in enumerate(metrics, start=3):
-            ws[f'A{i}'] = label
-            ws[f'A{i}'].font = header_font if not label.startswith(" ") else Font()
-            ws[f'B{i}'] = value
+        for label, value in metrics:
+            label_cell = _styled_cell(ws, label, font=_LABEL_FONT if not label.startswith(" ") else _PLAIN_FONT)
             
             # Highlight coverage status
             if "Coverage Percentage" in label:
                 if coverage_report.coverage_percentage >= 100:
-                    ws[f'B{i}'].fill = PatternFill(
-                        start_color="27AE60", end_color="27AE60", fill_type="solid"
-                    )
+                    value = _styled_cell(ws, value, fill=_COVERED_FILL)
                 else:
-                    ws[f'B{i}'].fill = PatternFill(
-                        start_color="E74C3C", end_color="E74C3C", fill_type="solid"
-                    )
+                    value = _styled_cell(ws, value, fill=_UNCOVERED_FILL)
+            
+            ws.append([label_cell, value])
         
         # List uncovered requirements
         if coverage_report.uncovered_requirements:
-            row = 16
-            ws[f'A{row}'] = "UNCOVERED REQUIREMENTS (CRITICAL):"
-            ws[f'A{row}'].font = Font(bold=True, color="FF0000")
+            ws.append([])
+            ws.append([_styled_cell(ws, "UNCOVERED REQUIREMENTS (CRITICAL):",
+                                    font=_BOLD_RED_FONT)])
             
             for req_id in coverage_report.uncovered_requirements:
-                row += 1
-                ws[f'A{row}'] = f"  ✗ {req_id}"
-                ws[f'A{row}'].fill = PatternFill(
-                    start_color="FADBD8", end_color="FADBD8", fill_type="solid"
-                )
-        
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 20
+                ws.append([_styled_cell(ws, f"  ✗ {req_id}", fill=_UNCOVERED_LIGHT_FILL)])
     
     def run(self) -> bool:
         """
@@ -841,17 +949,17 @@ class WIFTestCaseGenerator:
         self.logger.info("=" * 70)
         
         try:
-            # 1. Load requirements
-            self._load_requirements()
+            # 1. Load requirements, generating each test case as its row is read
+            self._load_requirements(on_requirement=self._emit_test_case)
             
             if not self.requirements:
                 self.logger.error("CRITICAL: No requirements loaded!")
                 return False
             
-            # 2. Generate test cases by type
-            self.generate_system_test_cases()
-            self.generate_software_test_cases()
-            self.generate_diagnostic_test_cases()
+            # 2. Report generated test cases by type
+            for req_type in RequirementType:
+                self.logger.info("Generated %d %s Test Cases",
+                                 len(self._tcs_by_type[req_type]), req_type.value)
             
             # 3. Validate all test cases
             is_valid, errors = self.validate_all_test_cases()
@@ -868,33 +976,35 @@ class WIFTestCaseGenerator:
             self.logger.info("=" * 70)
             
             # Count critical errors only (not warnings)
-            critical_errors = [e for e in errors if e.severity == "CRITICAL"]
-            warning_count = len([e for e in errors if e.severity == "WARNING"])
+            severity_counts = Counter(e.severity for e in errors)
+            critical_count = severity_counts["CRITICAL"]
+            warning_count = severity_counts["WARNING"]
             
             if warning_count > 0:
-                self.logger.info(f"  Note: {warning_count} non-blocking warnings logged")
+                self.logger.info("  Note: %d non-blocking warnings logged", warning_count)
+            
+            # Per-type checks read straight from the type indexes
+            tcs_by_type = self._tcs_by_type
+            reqs_by_type = self._reqs_by_type
             
             checklist = [
-                (len([tc for tc in self.test_cases if tc.type == RequirementType.SYSTEM]) > 0 or 
-                 len([r for r in self.requirements.values() if r.req_type == RequirementType.SYSTEM]) == 0,
+                (bool(tcs_by_type[RequirementType.SYSTEM]) or not reqs_by_type[RequirementType.SYSTEM],
                  "Every SYS_WIF_XXX has ≥1 test case"),
-                (len([tc for tc in self.test_cases if tc.type == RequirementType.SOFTWARE]) > 0 or
-                 len([r for r in self.requirements.values() if r.req_type == RequirementType.SOFTWARE]) == 0,
+                (bool(tcs_by_type[RequirementType.SOFTWARE]) or not reqs_by_type[RequirementType.SOFTWARE],
                  "Every SW_WIF_XXX has ≥1 test case"),
-                (len([tc for tc in self.test_cases if tc.type == RequirementType.DIAGNOSTIC]) > 0 or
-                 len([r for r in self.requirements.values() if r.req_type == RequirementType.DIAGNOSTIC]) == 0,
+                (bool(tcs_by_type[RequirementType.DIAGNOSTIC]) or not reqs_by_type[RequirementType.DIAGNOSTIC],
                  "Every DIAG_WIF_XXX has ≥1 test case"),
                 (is_valid, "All test case IDs follow naming convention"),
                 (is_valid, "All ASIL levels match source requirements"),
                 (coverage.is_complete(), "Traceability matrix shows 100% coverage"),
-                (len(critical_errors) == 0, "No critical validation errors"),
+                (critical_count == 0, "No critical validation errors"),
                 (all(p.exists() for p in output_files.values()), "JSON files are valid (parseable)"),
             ]
             
             all_passed = True
             for passed, description in checklist:
                 status = "✓" if passed else "✗"
-                self.logger.info(f"  [{status}] {description}")
+                self.logger.info("  [%s] %s", status, description)
                 if not passed:
                     all_passed = False
             
@@ -907,7 +1017,7 @@ class WIFTestCaseGenerator:
                 return False
                 
         except Exception as e:
-            self.logger.exception(f"CRITICAL ERROR: {e}")
+            self.logger.exception("CRITICAL ERROR: %s", e)
             return False
 
 
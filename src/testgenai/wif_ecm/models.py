@@ -38,7 +38,7 @@ class TestEnvironment(Enum):
     VEHICLE = "Vehicle"
 
 
-@dataclass
+@dataclass(slots=True)
 class Traceability:
     """Traceability block for parent-child requirement mapping"""
     system_req: Optional[str] = None
@@ -55,7 +55,7 @@ class Traceability:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WIFRequirement:
     """
     Requirement model for WIF ECM
@@ -84,7 +84,7 @@ class WIFRequirement:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WIFTestStep:
     """
     Single atomic test step
@@ -104,7 +104,7 @@ class WIFTestStep:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WIFTestCase:
     """
     Complete test case for WIF ECM validation
@@ -144,7 +144,7 @@ class WIFTestCase:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Validation error with severity and details"""
     test_case_id: str
@@ -156,7 +156,7 @@ class ValidationError:
         return f"[{self.severity}] {self.test_case_id}: {self.error_type} - {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageReport:
     """Coverage analysis report"""
     total_requirements: int = 0
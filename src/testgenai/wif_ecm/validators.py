@@ -5,7 +5,8 @@ Zero-tolerance validation for ASIL-A compliance
 
 import re
 import logging
-from typing import Dict, List, Set, Tuple, Optional
+from collections import Counter
+from typing import Dict, FrozenSet, List, Pattern, Set, Tuple, Optional
 from .models import (
     WIFTestCase,
     WIFRequirement,
@@ -16,6 +17,12 @@ from .models import (
 )
 
 
+# Aliases for the per-test-case rules, compared by identity
+_SYSTEM = RequirementType.SYSTEM
+_SOFTWARE = RequirementType.SOFTWARE
+_DIAGNOSTIC = RequirementType.DIAGNOSTIC
+
+
 class TestCaseValidator:
     """
     Production-grade validator for WIF ECM test cases
@@ -27,6 +34,13 @@ class TestCaseValidator:
     SOFTWARE_TC_PATTERN = re.compile(r'^TC_SW_SW_WIF_\d{3}_\d{3}$')
     DIAGNOSTIC_TC_PATTERN = re.compile(r'^TC_DIAG_DIAG_WIF_\d{3}_\d{3}$')
     
+    # Test case ID pattern per requirement type
+    _TC_ID_PATTERNS: Dict[RequirementType, Pattern] = {
+        RequirementType.SYSTEM: SYSTEM_TC_PATTERN,
+        RequirementType.SOFTWARE: SOFTWARE_TC_PATTERN,
+        RequirementType.DIAGNOSTIC: DIAGNOSTIC_TC_PATTERN,
+    }
+    
     # DTC code pattern (P + 4 hex digits)
     DTC_PATTERN = re.compile(r'^P[0-9A-Fa-f]{4}$')
     
@@ -38,6 +52,22 @@ class TestCaseValidator:
     SW_REQ_PATTERN = re.compile(r'^SW_WIF_\d{3}$')
     DIAG_REQ_PATTERN = re.compile(r'^DIAG_WIF_\d{3}$')
     
+    # Vague wording that makes a step non-verifiable, combined into a single
+    # alternation so each field is scanned once
+    VAGUE_PATTERNS = (
+        r'^\s*check\s*$',
+        r'^\s*verify\s*$',
+        r'^\s*test\s*$',
+        r'^\s*confirm\s*$',
+        r'if\s+working',
+        r'working\s+correctly',
+        r'as\s+expected',
+    )
+    VAGUE_PATTERN = re.compile('|'.join(f'(?:{p})' for p in VAGUE_PATTERNS), re.IGNORECASE)
+    
+    # Measurable content (numbers, operators, or specific values)
+    MEASURABLE_PATTERN = re.compile(r'[<>=≤≥]|\d+|true|false|0x[0-9A-Fa-f]+', re.IGNORECASE)
+    
     def __init__(self, 
                  requirements: Dict[str, WIFRequirement],
                  a2l_parameters: Optional[Set[str]] = None,
@@ -49,8 +79,13 @@ class TestCaseValidator:
             requirements: Dictionary of requirement ID -> WIFRequirement
             a2l_parameters: Set of valid A2L parameter names
             logger: Optional logger for error reporting
+            
+        Note:
+            Requirements must not change after construction - the ID set used
+            for coverage checks is computed once here.
         """
         self.requirements = requirements
+        self._all_req_ids: FrozenSet[str] = frozenset(requirements)
         self.a2l_parameters = a2l_parameters or set()
         self.logger = logger or logging.getLogger(__name__)
         self.errors: List[ValidationError] = []
@@ -77,8 +112,8 @@ class TestCaseValidator:
         else:
             req = self.requirements[tc.requirement_id]
             
-            # 2. ASIL level must match requirement
-            if tc.asil_level != req.asil_level:
+            # 2. ASIL level must match requirement (enum members are singletons)
+            if tc.asil_level is not req.asil_level:
                 errors.append(ValidationError(
                     test_case_id=tc.test_case_id,
                     error_type="ASIL_MISMATCH",
@@ -86,7 +121,7 @@ class TestCaseValidator:
                 ))
             
             # 3. Type must match requirement
-            if tc.type != req.req_type:
+            if tc.type is not req.req_type:
                 errors.append(ValidationError(
                     test_case_id=tc.test_case_id,
                     error_type="TYPE_MISMATCH",
@@ -103,7 +138,7 @@ class TestCaseValidator:
             ))
         
         # 5. DTC codes must be valid for diagnostic tests
-        if tc.type == RequirementType.DIAGNOSTIC or "DIAG" in tc.requirement_id:
+        if tc.type is _DIAGNOSTIC or "DIAG" in tc.requirement_id:
             if tc.dtc_code and not self.DTC_PATTERN.match(tc.dtc_code):
                 errors.append(ValidationError(
                     test_case_id=tc.test_case_id,
@@ -142,27 +177,23 @@ class TestCaseValidator:
                 message="Pass criteria must be specific and unambiguous (min 10 chars)"
             ))
         
-        # Log errors (warnings as warnings, critical as errors)
-        for error in errors:
-            if error.severity == "WARNING":
-                self.logger.warning(str(error))
-            else:
-                self.logger.error(str(error))
-            self.errors.append(error)
+        # Log errors with one call per severity (warnings as warnings,
+        # critical as errors) instead of one call per error
+        if errors:
+            warnings = [str(e) for e in errors if e.severity == "WARNING"]
+            if warnings:
+                self.logger.warning("\n".join(warnings))
+            if len(warnings) < len(errors):
+                self.logger.error("\n".join(str(e) for e in errors if e.severity != "WARNING"))
+            self.errors.extend(errors)
         
         # Only CRITICAL errors cause validation failure
-        critical_errors = [e for e in errors if e.severity == "CRITICAL"]
-        return len(critical_errors) == 0, errors
+        return not any(e.severity == "CRITICAL" for e in errors), errors
     
     def _validate_test_case_id(self, tc: WIFTestCase) -> bool:
         """Validate test case ID format based on type"""
-        if tc.type == RequirementType.SYSTEM:
-            return bool(self.SYSTEM_TC_PATTERN.match(tc.test_case_id))
-        elif tc.type == RequirementType.SOFTWARE:
-            return bool(self.SOFTWARE_TC_PATTERN.match(tc.test_case_id))
-        elif tc.type == RequirementType.DIAGNOSTIC:
-            return bool(self.DIAGNOSTIC_TC_PATTERN.match(tc.test_case_id))
-        return False
+        pattern = self._TC_ID_PATTERNS.get(tc.type)
+        return bool(pattern and pattern.match(tc.test_case_id))
     
     def _validate_test_steps(self, tc: WIFTestCase) -> List[ValidationError]:
         """Validate test steps are atomic and measurable"""
@@ -176,40 +207,25 @@ class TestCaseValidator:
             ))
             return errors
         
-        vague_patterns = [
-            r'^\s*check\s*$',
-            r'^\s*verify\s*$',
-            r'^\s*test\s*$',
-            r'^\s*confirm\s*$',
-            r'if\s+working',
-            r'working\s+correctly',
-            r'as\s+expected',
-        ]
-        
         for step in tc.test_steps:
             # Check for vague actions
-            for pattern in vague_patterns:
-                if re.search(pattern, step.action, re.IGNORECASE):
-                    errors.append(ValidationError(
-                        test_case_id=tc.test_case_id,
-                        error_type="VAGUE_ACTION",
-                        message=f"Step {step.step_no}: Action is too vague: '{step.action}'"
-                    ))
-                    break
+            if self.VAGUE_PATTERN.search(step.action):
+                errors.append(ValidationError(
+                    test_case_id=tc.test_case_id,
+                    error_type="VAGUE_ACTION",
+                    message=f"Step {step.step_no}: Action is too vague: '{step.action}'"
+                ))
             
             # Check for vague expected results
-            for pattern in vague_patterns:
-                if re.search(pattern, step.expected_result, re.IGNORECASE):
-                    errors.append(ValidationError(
-                        test_case_id=tc.test_case_id,
-                        error_type="VAGUE_EXPECTED_RESULT",
-                        message=f"Step {step.step_no}: Expected result is too vague: '{step.expected_result}'"
-                    ))
-                    break
+            if self.VAGUE_PATTERN.search(step.expected_result):
+                errors.append(ValidationError(
+                    test_case_id=tc.test_case_id,
+                    error_type="VAGUE_EXPECTED_RESULT",
+                    message=f"Step {step.step_no}: Expected result is too vague: '{step.expected_result}'"
+                ))
             
             # Check step has measurable content (contains numbers, operators, or specific values)
-            measurable_pattern = r'[<>=≤≥]|\d+|true|false|0x[0-9A-Fa-f]+'
-            if not re.search(measurable_pattern, step.expected_result, re.IGNORECASE):
+            if not self.MEASURABLE_PATTERN.search(step.expected_result):
                 errors.append(ValidationError(
                     test_case_id=tc.test_case_id,
                     error_type="NON_MEASURABLE_RESULT",
@@ -223,9 +239,10 @@ class TestCaseValidator:
         """Validate traceability block completeness"""
         errors = []
         trace = tc.traceability
+        tc_type = tc.type
         
         # System tests must have system_req
-        if tc.type == RequirementType.SYSTEM and not trace.system_req:
+        if tc_type is _SYSTEM and not trace.system_req:
             errors.append(ValidationError(
                 test_case_id=tc.test_case_id,
                 error_type="MISSING_SYSTEM_TRACE",
@@ -233,7 +250,7 @@ class TestCaseValidator:
             ))
         
         # Software tests should trace to system req if parent exists
-        if tc.type == RequirementType.SOFTWARE:
+        if tc_type is _SOFTWARE:
             if not trace.software_req:
                 errors.append(ValidationError(
                     test_case_id=tc.test_case_id,
@@ -252,7 +269,7 @@ class TestCaseValidator:
                     ))
         
         # Diagnostic tests must have diagnostic_req
-        if tc.type == RequirementType.DIAGNOSTIC and not trace.diagnostic_req:
+        if tc_type is _DIAGNOSTIC and not trace.diagnostic_req:
             errors.append(ValidationError(
                 test_case_id=tc.test_case_id,
                 error_type="MISSING_DIAGNOSTIC_TRACE",
@@ -306,57 +323,35 @@ class TestCaseValidator:
             CoverageReport with coverage analysis
         """
         report = CoverageReport()
-        
-        # Count requirements by type
-        sys_reqs = set()
-        sw_reqs = set()
-        diag_reqs = set()
-        
-        for req_id, req in self.requirements.items():
-            if req.req_type == RequirementType.SYSTEM:
-                sys_reqs.add(req_id)
-            elif req.req_type == RequirementType.SOFTWARE:
-                sw_reqs.add(req_id)
-            elif req.req_type == RequirementType.DIAGNOSTIC:
-                diag_reqs.add(req_id)
-        
-        report.total_requirements = len(self.requirements)
+        report.total_requirements = len(self._all_req_ids)
         
         # Count test cases and track coverage
-        covered_reqs = set()
-        
-        for tc in test_cases:
-            covered_reqs.add(tc.requirement_id)
-            
-            if tc.type == RequirementType.SYSTEM:
-                report.system_test_cases += 1
-            elif tc.type == RequirementType.SOFTWARE:
-                report.software_test_cases += 1
-            elif tc.type == RequirementType.DIAGNOSTIC:
-                report.diagnostic_test_cases += 1
+        covered_reqs = {tc.requirement_id for tc in test_cases}
+        type_counts = Counter(tc.type for tc in test_cases)
+        report.system_test_cases = type_counts[RequirementType.SYSTEM]
+        report.software_test_cases = type_counts[RequirementType.SOFTWARE]
+        report.diagnostic_test_cases = type_counts[RequirementType.DIAGNOSTIC]
         
         report.total_test_cases = len(test_cases)
         report.covered_requirements = len(covered_reqs)
         
-        # Find uncovered requirements
-        all_req_ids = set(self.requirements.keys())
-        uncovered = all_req_ids - covered_reqs
-        report.uncovered_requirements = list(sorted(uncovered))
-        
         # Calculate coverage
         if report.total_requirements > 0:
             report.coverage_percentage = (report.covered_requirements / report.total_requirements) * 100.0
         else:
             report.coverage_percentage = 100.0
         
-        # Log uncovered requirements
-        for req_id in report.uncovered_requirements:
-            self.logger.error(f"CRITICAL: Requirement '{req_id}' has ZERO test cases!")
-            self.errors.append(ValidationError(
-                test_case_id="N/A",
-                error_type="UNCOVERED_REQUIREMENT",
-                message=f"Requirement '{req_id}' has no test cases"
-            ))
+        # Find and log uncovered requirements - skipped entirely on full coverage
+        uncovered = self._all_req_ids - covered_reqs
+        if uncovered:
+            report.uncovered_requirements = sorted(uncovered)
+            for req_id in report.uncovered_requirements:
+                self.logger.error("CRITICAL: Requirement '%s' has ZERO test cases!", req_id)
+                self.errors.append(ValidationError(
+                    test_case_id="N/A",
+                    error_type="UNCOVERED_REQUIREMENT",
+                    message=f"Requirement '{req_id}' has no test cases"
+                ))
         
         return report
     
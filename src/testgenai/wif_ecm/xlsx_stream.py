@@ -0,0 +1,307 @@
+"""
+WIF ECM Streaming XLSX Writer
+Emits SpreadsheetML directly for very large traceability matrices
+"""
+
+import math
+import re
+import tempfile
+import zipfile
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.xml.functions import tostring
+
+
+# Characters that are not allowed in XML 1.0 text (same set openpyxl rejects)
+_ILLEGAL_XML_RE = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
+
+_SHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_CONTENT_TYPES_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+
+class StyledValue:
+    """Cell value paired with a registered cell-format (xf) index"""
+    __slots__ = ("value", "style_id")
+
+    def __init__(self, value: Any, style_id: int):
+        self.value = value
+        self.style_id = style_id
+
+
+class _ColumnDimension:
+    """Holds a column width, mirroring openpyxl's ColumnDimension.width"""
+    __slots__ = ("width",)
+
+    def __init__(self):
+        self.width: Optional[float] = None
+
+
+class _ColumnDimensions(dict):
+    """Auto-creating column-letter -> dimension map"""
+
+    def __missing__(self, key: str) -> _ColumnDimension:
+        dim = _ColumnDimension()
+        self[key] = dim
+        return dim
+
+
+class _MergedCells(list):
+    """List of merged ranges exposing openpyxl's ``merged_cells.add``"""
+
+    def add(self, cell_range: str) -> None:
+        self.append(cell_range)
+
+
+class _StyleTable:
+    """
+    Collects the fonts, fills and alignments used by a workbook and
+    assigns each distinct combination a cell-format (xf) index
+    """
+
+    def __init__(self):
+        # Excel reserves fill 0 (none) and 1 (gray125)
+        self._fonts: List[bytes] = [tostring(DEFAULT_FONT.to_tree())]
+        self._fills: List[bytes] = [
+            tostring(PatternFill().to_tree()),
+            tostring(PatternFill(fill_type="gray125").to_tree()),
+        ]
+        self._xfs: List[Tuple[int, int, Optional[bytes]]] = [(0, 0, None)]
+        self._xf_ids: Dict[Tuple[int, int, Optional[bytes]], int] = {}
+        self._cache: Dict[Tuple[Optional[Font], Optional[PatternFill], Optional[Alignment]], int] = {}
+
+    def style_id(self, font: Optional[Font], fill: Optional[PatternFill],
+                 alignment: Optional[Alignment]) -> int:
+        """Get (registering if needed) the xf index for a style combination"""
+        key = (font, fill, alignment)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        font_id = self._index(self._fonts, font)
+        fill_id = self._index(self._fills, fill)
+        align_xml = tostring(alignment.to_tree()) if alignment is not None else None
+        xf = (font_id, fill_id, align_xml)
+        xf_id = self._xf_ids.get(xf)
+        if xf_id is None:
+            xf_id = len(self._xfs)
+            self._xfs.append(xf)
+            self._xf_ids[xf] = xf_id
+
+        # openpyxl style objects hash and compare by value, so equal styles
+        # built separately share one entry
+        self._cache[key] = xf_id
+        return xf_id
+
+    @staticmethod
+    def _index(table: List[bytes], style: Any) -> int:
+        if style is None:
+            return 0
+        xml = tostring(style.to_tree())
+        if xml not in table:
+            table.append(xml)
+        return table.index(xml)
+
+    def to_xml(self) -> str:
+        xfs = []
+        for font_id, fill_id, align_xml in self._xfs:
+            attrs = f'numFmtId="0" fontId="{font_id}" fillId="{fill_id}" borderId="0" xfId="0"'
+            if font_id:
+                attrs += ' applyFont="1"'
+            if fill_id:
+                attrs += ' applyFill="1"'
+            if align_xml:
+                xfs.append(f'<xf {attrs} applyAlignment="1">{align_xml.decode()}</xf>')
+            else:
+                xfs.append(f'<xf {attrs}/>')
+
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<styleSheet xmlns="{_SHEET_NS}">'
+            f'<fonts count="{len(self._fonts)}">{b"".join(self._fonts).decode()}</fonts>'
+            f'<fills count="{len(self._fills)}">{b"".join(self._fills).decode()}</fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        )
+
+
+class StreamingSheet:
+    """
+    Write-only worksheet that serializes each appended row straight to
+    SpreadsheetML. Column widths and merges must be set before the first
+    row, as with openpyxl's write-only worksheets.
+    """
+
+    def __init__(self, workbook: "StreamingWorkbook", title: str):
+        self.workbook = workbook
+        self.title = title
+        self.column_dimensions = _ColumnDimensions()
+        self.merged_cells = _MergedCells()
+        self._buffer = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+        self._row_idx = 0
+        self._started = False
+
+    def styled(self, value: Any, font: Optional[Font] = None, fill: Optional[PatternFill] = None,
+               alignment: Optional[Alignment] = None) -> StyledValue:
+        """Build a styled cell for appending to this sheet"""
+        return StyledValue(value, self.workbook.styles.style_id(font, fill, alignment))
+
+    def append(self, row: Iterable[Any]) -> None:
+        """Serialize one row of values / StyledValue cells"""
+        if not self._started:
+            self._write_cols()
+            self._started = True
+
+        self._row_idx += 1
+        r = self._row_idx
+        cells = []
+        for col_idx, value in enumerate(row, 1):
+            style_id = 0
+            if isinstance(value, StyledValue):
+                style_id = value.style_id
+                value = value.value
+            # Like openpyxl, empty strings are written as blank cells
+            if value == "":
+                value = None
+            if value is None and not style_id:
+                continue
+            ref = f'{get_column_letter(col_idx)}{r}'
+            style_attr = f' s="{style_id}"' if style_id else ''
+            cells.append(_cell_xml(ref, value, style_attr))
+
+        self._buffer.write(f'<row r="{r}">{"".join(cells)}</row>')
+
+    def _write_cols(self) -> None:
+        widths = sorted(
+            ((column_index_from_string(letter), dim.width) for letter, dim in self.column_dimensions.items()
+             if dim.width is not None)
+        )
+        if widths:
+            cols = "".join(
+                f'<col min="{idx}" max="{idx}" width="{width}" customWidth="1"/>' for idx, width in widths
+            )
+            self._buffer.write(f'<cols>{cols}</cols>')
+        self._buffer.write('<sheetData>')
+
+    def write_to(self, zf: zipfile.ZipFile, path: str) -> None:
+        """Copy the finished sheet XML into the archive"""
+        if not self._started:
+            self._write_cols()
+        self._buffer.write('</sheetData>')
+        if self.merged_cells:
+            merges = "".join(f'<mergeCell ref="{ref}"/>' for ref in self.merged_cells)
+            self._buffer.write(f'<mergeCells count="{len(self.merged_cells)}">{merges}</mergeCells>')
+        self._buffer.write('</worksheet>')
+        self._buffer.seek(0)
+
+        with zf.open(path, 'w') as out:
+            out.write(
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<worksheet xmlns="{_SHEET_NS}" xmlns:r="{_REL_NS}">'.encode('utf-8')
+            )
+            while True:
+                chunk = self._buffer.read(1 << 20)
+                if not chunk:
+                    break
+                out.write(chunk.encode('utf-8'))
+        self._buffer.close()
+
+
+class StreamingWorkbook:
+    """
+    Minimal write-only XLSX workbook
+
+    Mirrors the subset of openpyxl's write-only API used by the
+    traceability exporter (create_sheet / append / column widths /
+    merged ranges / save) but skips per-cell object construction.
+    """
+
+    def __init__(self):
+        self.styles = _StyleTable()
+        self._sheets: List[StreamingSheet] = []
+
+    def create_sheet(self, title: str) -> StreamingSheet:
+        sheet = StreamingSheet(self, title)
+        self._sheets.append(sheet)
+        return sheet
+
+    def save(self, path) -> None:
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            overrides = "".join(
+                f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for i in range(1, len(self._sheets) + 1)
+            )
+            zf.writestr('[Content_Types].xml', f'{_CONTENT_TYPES_HEAD}{overrides}</Types>')
+            zf.writestr('_rels/.rels', _ROOT_RELS)
+
+            sheets = "".join(
+                f'<sheet name={quoteattr(sheet.title)} sheetId="{i}" r:id="rId{i}"/>'
+                for i, sheet in enumerate(self._sheets, 1)
+            )
+            zf.writestr(
+                'xl/workbook.xml',
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<workbook xmlns="{_SHEET_NS}" xmlns:r="{_REL_NS}"><sheets>{sheets}</sheets></workbook>'
+            )
+
+            rels = "".join(
+                f'<Relationship Id="rId{i}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                for i in range(1, len(self._sheets) + 1)
+            )
+            styles_rel = len(self._sheets) + 1
+            zf.writestr(
+                'xl/_rels/workbook.xml.rels',
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                f'<Relationships xmlns="{_PKG_REL_NS}">{rels}'
+                f'<Relationship Id="rId{styles_rel}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+                '</Relationships>'
+            )
+
+            for i, sheet in enumerate(self._sheets, 1):
+                sheet.write_to(zf, f'xl/worksheets/sheet{i}.xml')
+
+            zf.writestr('xl/styles.xml', self.styles.to_xml())
+
+
+def _cell_xml(ref: str, value: Any, style_attr: str) -> str:
+    """Serialize a single cell"""
+    if value is None:
+        return f'<c r="{ref}"{style_attr}/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{style_attr} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, float) and not math.isfinite(value):
+        # Like openpyxl, NaN and infinities are written without a value
+        return f'<c r="{ref}"{style_attr}/>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{style_attr}><v>{value}</v></c>'
+
+    text = _ILLEGAL_XML_RE.sub('', str(value))
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<c r="{ref}"{style_attr} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
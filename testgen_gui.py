@@ -3,28 +3,84 @@
 TestGenAI - Graphical User Interface
 A user-friendly interface for automated test case generation with AI support
 """
+import io
+import os
+import queue
+import socket
 import sys
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import font as tkfont
 from pathlib import Path
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime
+from importlib.util import find_spec
 
-sys.path.insert(0, 'src')
+# Absolute, so spawned PDF workers (which re-import this script) and runs
+# started from another directory still find the package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
-from testgenai.ingestion.doc_parser import load_requirements
-from testgenai.models.requirement import Requirement
-from testgenai.rules.rule_engine import RuleEngine
-from testgenai.mapping.traceability import build_trace_matrix
-from testgenai.reports.stp_writer import write_stp_output
-# Lazy import for Copilot to avoid crashing if dependencies are missing
-try:
-    from testgenai.llm_copilot.copilot_session import CopilotSession
-    from testgenai.llm_copilot.prompt_builder import build_prompt
-    from testgenai.llm_copilot.response_parser import parse_table_response
-    HAS_LLM_DEPS = True
-except ImportError:
-    HAS_LLM_DEPS = False
+from testgenai.llm_copilot.cache import LLMCache
+
+# The testgenai pipeline (pandas/openpyxl/selenium) and the process pool
+# are imported on first use in run_generation so the window appears without
+# waiting for them. Copilot support is only probed here, without importing
+# selenium.
+HAS_LLM_DEPS = find_spec("selenium") is not None
+
+
+# Requirement document types picked up from the input folder
+REQ_EXTENSIONS = ('.txt', '.md', '.docx', '.pdf', '.xlsx')
+
+# Copilot prompt batches, bounded by estimated requirement tokens and count;
+# each batch is cached and may fail on its own
+AI_BATCH_TOKENS = 6000
+AI_BATCH_SIZE = 20
+AI_BATCH_TIMEOUT_S = 120
+
+# Log widget refresh: at most LOG_DRAIN_MAX queued lines every LOG_DRAIN_MS,
+# so a burst of messages cannot stall the Tk loop in one huge insert
+LOG_DRAIN_MAX = 200
+LOG_DRAIN_MS = 100
+
+# PDFs go to worker processes only when there are at least this many bytes
+# of them. pdfminer parses roughly 8 s/MB, while starting a spawn-based pool
+# (the Windows default) costs ~350 ms, so smaller sets are faster on threads.
+PDF_POOL_MIN_BYTES = 256 * 1024
+
+
+# Parsed requirement files, keyed by (path, st_mtime_ns, st_size) so an
+# unchanged document is not parsed again on the next Generate
+_REQ_CACHE = {}
+
+
+def req_cache_key(path):
+    st = os.stat(path)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+# How long to wait for Edge to open its DevTools port after launching it
+DEBUG_PORT_WAIT_S = 60
+
+
+def debug_port_open(port, timeout=0.5):
+    """True if something accepts connections on the local DevTools port"""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def ingest_workers():
+    """Number of requirement files parsed in parallel (override with TESTGEN_INGEST_WORKERS)"""
+    try:
+        return max(1, int(os.environ["TESTGEN_INGEST_WORKERS"]))
+    except (KeyError, ValueError):
+        return min(8, os.cpu_count() or 4)
 
 
 class TestGenAIGUI:
@@ -40,12 +96,26 @@ class TestGenAIGUI:
         
         # AI Variables
         self.use_ai = tk.BooleanVar(value=True)
+        self.use_cache = tk.BooleanVar(value=True)
         self.ai_url = tk.StringVar(value="https://copilot.microsoft.com")
         self.debug_port = tk.IntVar(value=9222)
         
         self.requirements_found = []
+        self._scan_cache = {}  # (folder, st_mtime_ns) -> requirement files
+        self._template_cache = (None, b"")  # (req_cache_key, template bytes)
         self.is_processing = False
         
+        # AI response cache, shared by every run in this session
+        self.llm_cache = LLMCache()
+        self.stats = {"cache_hits": 0, "cache_misses": 0}
+        
+        # Copilot browser session, kept open across runs until AI is
+        # switched off or the window closes
+        self.copilot = None
+        
+        # Log lines from any thread, flushed into the log widget by _drain_log
+        self._log_q = queue.Queue()
+        
         # Colors
         self.bg_color = "#f4f6f9"
         self.accent_color = "#2c3e50"
@@ -55,8 +125,25 @@ class TestGenAIGUI:
         self.warning_color = "#d35400"
         
         self.root.configure(bg=self.bg_color)
+        
+        # Fonts, created once and shared by every widget
+        self.f_title = tkfont.Font(family="Segoe UI", size=20, weight="bold")
+        self.f_section = tkfont.Font(family="Segoe UI", size=11, weight="bold")
+        self.f_button = tkfont.Font(family="Segoe UI", size=12, weight="bold")
+        self.f_body = tkfont.Font(family="Segoe UI", size=10)
+        self.f_body_bold = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        self.f_small = tkfont.Font(family="Segoe UI", size=9)
+        self.f_small_italic = tkfont.Font(family="Segoe UI", size=9, slant="italic")
+        self.f_mono = tkfont.Font(family="Consolas", size=9)
+        
+        # Build the widget tree while the window is unmapped so Tk lays it
+        # out once on deiconify instead of after every pack()
+        self.root.withdraw()
         self.create_widgets()
+        self.root.deiconify()
         self.center_window()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(LOG_DRAIN_MS, self._drain_log)
         
     def center_window(self):
         self.root.update_idletasks()
@@ -72,28 +159,28 @@ class TestGenAIGUI:
         title_frame.pack(fill=tk.X)
         title_frame.pack_propagate(False)
         
-        tk.Label(title_frame, text="🚀 TestGenAI Enterprise", font=("Segoe UI", 20, "bold"), bg=self.header_color, fg="white").pack(pady=(15,5))
-        tk.Label(title_frame, text="Generate ISO 26262 Compliant Test Cases with AI", font=("Segoe UI", 10), bg=self.header_color, fg="#ecf0f1").pack()
-        
-        # Main Canvas
-        main_canvas = tk.Canvas(self.root, bg=self.bg_color, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=main_canvas.yview)
-        scrollable_frame = tk.Frame(main_canvas, bg=self.bg_color)
+        tk.Label(title_frame, text="🚀 TestGenAI Enterprise", font=self.f_title, bg=self.header_color, fg="white").pack(pady=(15,5))
+        tk.Label(title_frame, text="Generate ISO 26262 Compliant Test Cases with AI", font=self.f_body, bg=self.header_color, fg="#ecf0f1").pack()
         
-        scrollable_frame.bind("<Configure>", lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all")))
-        main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
+        # Action buttons stay below the tabs so Generate is always visible
+        btn_row = tk.Frame(self.root, bg=self.bg_color)
+        btn_row.pack(side=tk.BOTTOM, fill=tk.X, padx=30, pady=10)
         
-        main_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Tabs
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
         
-        content = tk.Frame(scrollable_frame, bg=self.bg_color)
-        content.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
+        content = tk.Frame(self.notebook, bg=self.bg_color, padx=20, pady=20)
+        ai_tab = tk.Frame(self.notebook, bg=self.bg_color, padx=20, pady=20)
+        self.log_tab = tk.Frame(self.notebook, bg=self.bg_color, padx=20, pady=20)
+        self.notebook.add(content, text="Input/Output")
+        self.notebook.add(ai_tab, text="AI")
+        self.notebook.add(self.log_tab, text="Log")
         
         # --- 1. Requirements Input ---
         self.create_path_section(content, "1. Requirements Input", self.input_folder, self.browse_input_folder, 
             "Select folder containing requirement docs (.txt, .docx, .pdf, .xlsx):")
-        self.files_label = tk.Label(content, text="No folder selected", font=("Segoe UI", 9, "italic"), bg=self.bg_color, fg="#7f8c8d")
+        self.files_label = tk.Label(content, text="No folder selected", font=self.f_small_italic, bg=self.bg_color, fg="#7f8c8d")
         self.files_label.pack(anchor=tk.W, padx=20, pady=(0, 20))
 
         # --- 2. Master Template ---
@@ -105,15 +192,15 @@ class TestGenAIGUI:
             "Select folder to save the generated Test Plan:")
         
         # --- 4. AI Engine ---
-        ai_frame = tk.LabelFrame(content, text="4. AI Engine (Copilot)", font=("Segoe UI", 11, "bold"), bg=self.bg_color, fg=self.header_color)
+        ai_frame = tk.LabelFrame(ai_tab, text="4. AI Engine (Copilot)", font=self.f_section, bg=self.bg_color, fg=self.header_color)
         ai_frame.pack(fill=tk.X, pady=(0, 20), padx=5)
         
         ai_inner = tk.Frame(ai_frame, bg=self.bg_color)
         ai_inner.pack(fill=tk.X, padx=15, pady=15)
         
         # Checkbox
-        tk.Checkbutton(ai_inner, text="Enable AI Generation", variable=self.use_ai, 
-                      font=("Segoe UI", 10, "bold"), bg=self.bg_color, activebackground=self.bg_color).pack(anchor=tk.W)
+        tk.Checkbutton(ai_inner, text="Enable AI Generation", variable=self.use_ai, command=self.toggle_ai_options,
+                      font=self.f_body_bold, bg=self.bg_color, activebackground=self.bg_color).pack(anchor=tk.W)
         
         help_text = ("This mode connects to an EXISTING Edge browser session to avoid Captchas.\n"
                      "1. Click 'Launch Browser & Login'.\n"
@@ -122,48 +209,83 @@ class TestGenAIGUI:
         tk.Label(ai_inner, text=help_text, justify=tk.LEFT, bg="#e8f6f3", fg="#16a085", relief=tk.SOLID, borderwidth=1, padx=10, pady=5).pack(anchor=tk.W, fill=tk.X, pady=10)
         
         btn_launch = tk.Button(ai_inner, text="🌐 Launch Browser & Login", command=self.launch_browser_debug,
-                              bg="#2980b9", fg="white", font=("Segoe UI", 10, "bold"), padx=15, pady=5, relief=tk.FLAT)
+                              bg="#2980b9", fg="white", font=self.f_body_bold, padx=15, pady=5, relief=tk.FLAT)
         btn_launch.pack(anchor=tk.W)
+        
+        chk_cache = tk.Checkbutton(ai_inner, text="Reuse cached AI responses (resume interrupted runs)", variable=self.use_cache,
+                                   font=self.f_body, bg=self.bg_color, activebackground=self.bg_color)
+        chk_cache.pack(anchor=tk.W, pady=(10, 0))
+        
+        # Widgets that follow the AI checkbox, collected once so toggling
+        # never has to walk the widget tree
+        self._ai_toggleable = [btn_launch, chk_cache]
 
         # --- Logs ---
-        log_frame = tk.LabelFrame(content, text="Activity Log", font=("Segoe UI", 11, "bold"), bg=self.bg_color, fg=self.header_color)
+        log_frame = tk.LabelFrame(self.log_tab, text="Activity Log", font=self.f_section, bg=self.bg_color, fg=self.header_color)
         log_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 20))
-        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, font=("Consolas", 9), relief=tk.FLAT)
+        self.log_text = scrolledtext.ScrolledText(log_frame, height=10, font=self.f_mono, relief=tk.FLAT)
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
         
         # --- Action Buttons ---
-        btn_row = tk.Frame(content, bg=self.bg_color)
-        btn_row.pack(fill=tk.X, pady=10)
-        
         self.generate_btn = tk.Button(btn_row, text="⚡ Generate Test Cases", command=self.generate_tests,
-                                     font=("Segoe UI", 12, "bold"), bg=self.success_color, fg="white", padx=40, pady=12, relief=tk.FLAT)
+                                     font=self.f_button, bg=self.success_color, fg="white", padx=40, pady=12, relief=tk.FLAT)
         self.generate_btn.pack(side=tk.LEFT)
         
-        tk.Button(btn_row, text="Exit", command=self.root.quit, font=("Segoe UI", 10), bg="#95a5a6", fg="white", padx=20, pady=12, relief=tk.FLAT).pack(side=tk.RIGHT)
+        tk.Button(btn_row, text="Exit", command=self._on_close, font=self.f_body, bg="#95a5a6", fg="white", padx=20, pady=12, relief=tk.FLAT).pack(side=tk.RIGHT)
+
+    def toggle_ai_options(self):
+        state = tk.NORMAL if self.use_ai.get() else tk.DISABLED
+        for w in self._ai_toggleable:
+            w.configure(state=state)
+        # A running generation may still be sending prompts through the
+        # session; finish_generation closes it once the run is over
+        if not self.use_ai.get() and not self.is_processing:
+            self.close_copilot()
+
+    def close_copilot(self):
+        if self.copilot is not None:
+            self.copilot.close()
+            self.copilot = None
+
+    def _on_close(self):
+        self.close_copilot()
+        self.root.destroy()
 
     def create_path_section(self, parent, title, var, cmd, desc):
-        frame = tk.LabelFrame(parent, text=title, font=("Segoe UI", 11, "bold"), bg=self.bg_color, fg=self.header_color)
+        frame = tk.LabelFrame(parent, text=title, font=self.f_section, bg=self.bg_color, fg=self.header_color)
         frame.pack(fill=tk.X, pady=(0, 5), padx=5)
         path_row = tk.Frame(frame, bg=self.bg_color)
         path_row.pack(fill=tk.X, padx=15, pady=15)
         
-        tk.Label(path_row, text=desc, bg=self.bg_color, font=("Segoe UI", 9)).pack(anchor=tk.W)
+        tk.Label(path_row, text=desc, bg=self.bg_color, font=self.f_small).pack(anchor=tk.W)
         
         entry_row = tk.Frame(path_row, bg=self.bg_color)
         entry_row.pack(fill=tk.X, pady=(5,0))
         
-        tk.Entry(entry_row, textvariable=var, font=("Segoe UI", 10), state="readonly", relief=tk.FLAT, bg="white").pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10), ipady=4)
+        tk.Entry(entry_row, textvariable=var, font=self.f_body, state="readonly", relief=tk.FLAT, bg="white").pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10), ipady=4)
         tk.Button(entry_row, text="Browse...", command=cmd, bg=self.accent_color, fg="white", padx=15, relief=tk.FLAT).pack(side=tk.LEFT)
 
     def browse_input_folder(self):
         f = filedialog.askdirectory()
         if f:
             self.input_folder.set(f)
-            self.scan_reqs(f)
+            threading.Thread(target=self.scan_reqs, args=(f,), daemon=True).start()
 
     def browse_template_file(self):
         f = filedialog.askopenfilename(filetypes=[("Excel Template", "*.xlsx")])
-        if f: self.template_path.set(f)
+        if f:
+            self.template_path.set(f)
+
+    def template_source(self, path):
+        """Template contents as a BytesIO, re-read from disk only when the file changed.
+
+        Called from the generation thread only: the stat and read can block
+        on a network share.
+        """
+        key = req_cache_key(path)
+        if self._template_cache[0] != key:
+            self._template_cache = (key, Path(path).read_bytes())
+        return io.BytesIO(self._template_cache[1])
 
     def browse_output_folder(self):
         f = filedialog.askdirectory()
@@ -172,16 +294,54 @@ class TestGenAIGUI:
     def launch_browser_debug(self):
         import subprocess
         try:
-            subprocess.Popen("launch_edge_debug.bat", shell=True)
+            # Start the script directly instead of through a shell string. It
+            # gets its own console so its login instructions stay visible.
+            bat = Path(__file__).with_name("launch_edge_debug.bat")
+            subprocess.Popen([str(bat)], close_fds=True,
+                             creationflags=getattr(subprocess, "CREATE_NEW_CONSOLE", 0))
             self.log("Browser launched. Please log in manually.", "info")
         except Exception as e:
             self.log(f"Failed to launch browser: {e}", "error")
+            return
+        threading.Thread(target=self.wait_for_debug_port, args=(self.debug_port.get(),), daemon=True).start()
+
+    def wait_for_debug_port(self, port):
+        deadline = time.monotonic() + DEBUG_PORT_WAIT_S
+        while time.monotonic() < deadline:
+            if debug_port_open(port):
+                self.root.after(0, self.on_browser_ready, port)
+                return
+            time.sleep(0.5)
+        self.log(f"Edge did not open debug port {port} within {DEBUG_PORT_WAIT_S}s.", "warning")
+
+    def on_browser_ready(self, port):
+        self.log(f"Edge is listening on debug port {port}.", "success")
+        if not self.is_processing:
+            self.generate_btn.config(text="⚡ Ready — Generate")
 
     def scan_reqs(self, folder):
-        p = Path(folder)
-        files = []
-        for ext in ['*.txt', '*.md', '*.docx', '*.pdf', '*.xlsx']:
-            files.extend(list(p.glob(ext)))
+        # Runs on a worker thread. The directory mtime changes whenever an
+        # entry is added, removed or renamed, so re-picking an unchanged
+        # folder reuses the previous scan.
+        try:
+            key = (folder, os.stat(folder).st_mtime_ns)
+            files = self._scan_cache.get(key)
+            if files is None:
+                # One directory pass instead of a glob per extension
+                with os.scandir(folder) as it:
+                    files = sorted(Path(e.path) for e in it
+                                   if e.name.lower().endswith(REQ_EXTENSIONS) and e.is_file())
+                self._scan_cache[key] = files
+        except OSError as e:
+            # Folder removed, unreadable or on a dropped network share
+            self.root.after(0, self.show_scan_error, folder, e)
+            return
+        self.root.after(0, self.show_scan_result, folder, files)
+
+    def show_scan_result(self, folder, files):
+        # A slower scan of a previously picked folder must not win
+        if folder != self.input_folder.get():
+            return
         
         # Exclude the selected template if it's in the same folder?
         # Just warn user if they pick the same file.
@@ -193,16 +353,39 @@ class TestGenAIGUI:
         else:
             self.files_label.config(text="⚠ No supported files found.", fg=self.error_color)
 
+    def show_scan_error(self, folder, error):
+        if folder != self.input_folder.get():
+            return
+        self.requirements_found = []
+        self.files_label.config(text="⚠ Could not read input folder.", fg=self.error_color)
+        self.log(f"Could not scan {folder}: {error}", "error")
+
     def log(self, msg, level="info"):
-        self.log_text.config(state=tk.NORMAL)
+        # Safe from worker threads: only the Tk thread touches the widget
         ts = datetime.now().strftime("%H:%M:%S")
         prefix = "❌" if level == "error" else "⚠" if level == "warning" else "✓" if level == "success" else "ℹ"
-        self.log_text.insert(tk.END, f"[{ts}] {prefix} {msg}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-        self.root.update_idletasks()
+        self._log_q.put(f"[{ts}] {prefix} {msg}\n")
+
+    def _drain_log(self):
+        lines = []
+        try:
+            while len(lines) < LOG_DRAIN_MAX:
+                lines.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "".join(lines))
+            self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+        self.root.after(LOG_DRAIN_MS, self._drain_log)
 
     def generate_tests(self):
+        # The button is disabled during a run; this also covers any other
+        # caller of generate_tests while a run is still in flight
+        if self.is_processing:
+            return
         if not self.input_folder.get() or not self.output_folder.get():
             messagebox.showerror("Missing Info", "Please select Input Folder and Output Folder.")
             return
@@ -211,75 +394,108 @@ class TestGenAIGUI:
             if not messagebox.askyesno("No Template", "No Template selected. Steps will be generic and formatting lost.\nContinue?"):
                 return
 
+        self.is_processing = True
         self.generate_btn.config(state=tk.DISABLED, text="⏳ Generating...")
+        self.notebook.select(self.log_tab)
         threading.Thread(target=self.run_generation, daemon=True).start()
 
     def run_generation(self):
         try:
             self.log("Starting Generation Process...", "info")
             
+            from testgenai.ingestion.doc_parser import load_requirements
+            from testgenai.models.requirement import Requirement
+            
             # 1. Load Requirements
-            all_reqs = []
+            # Paths are compared as normalised strings: resolve() would stat
+            # every path component of every file
+            tpl = self.template_path.get()
+            tpl_key = os.path.normcase(os.path.abspath(tpl)) if tpl else None
+            req_files = []
             for f in self.requirements_found:
                 # Skip if it is the template file itself
-                if self.template_path.get() and Path(f).resolve() == Path(self.template_path.get()).resolve():
+                if tpl_key and os.path.normcase(os.path.abspath(f)) == tpl_key:
                     continue
-                    
-                self.log(f"Reading: {f.name}...")
-                reqs = load_requirements(str(f))
+                req_files.append(f)
+            
+            # Files are parsed concurrently but merged in folder order so
+            # requirement order stays the same from run to run. pdfminer is
+            # pure Python and holds the GIL, so a large enough set of PDFs on
+            # a multi-core machine is parsed in worker processes instead.
+            results = [[] for _ in req_files]
+            keys = [req_cache_key(f) for f in req_files]
+            pending = []
+            for i, key in enumerate(keys):
+                if key in _REQ_CACHE:
+                    results[i] = _REQ_CACHE[key]
+                    self.log(f"Read: {req_files[i].name} ({len(results[i])} requirements, unchanged)")
+                else:
+                    pending.append(i)
+            
+            is_pdf = {i: req_files[i].suffix.lower() == ".pdf" for i in pending}
+            pdf_bytes = sum(keys[i][2] for i in pending if is_pdf[i])
+            pdf_workers = min(sum(is_pdf.values()), ingest_workers(), os.cpu_count() or 1)
+            pdf_pool = nullcontext()
+            if pdf_workers > 1 and pdf_bytes >= PDF_POOL_MIN_BYTES:
+                # Pulls in multiprocessing, so only imported when used. Always
+                # spawn: forking this process would copy the Tk and worker
+                # threads' state into the children. The workers only run
+                # doc_parser.load_requirements, which they import by name.
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                pdf_pool = ProcessPoolExecutor(max_workers=pdf_workers,
+                                               mp_context=multiprocessing.get_context("spawn"))
+            with ThreadPoolExecutor(max_workers=ingest_workers()) as ex, pdf_pool as px:
+                futures = {
+                    (px if px and is_pdf[i] else ex).submit(load_requirements, str(req_files[i])): i
+                    for i in pending
+                }
+                for fut in as_completed(futures):
+                    i = futures[fut]
+                    results[i] = _REQ_CACHE[keys[i]] = fut.result()
+                    self.log(f"Read: {req_files[i].name} ({len(results[i])} requirements)")
+            
+            all_reqs = []
+            for reqs in results:
                 all_reqs.extend(reqs)
             
             if not all_reqs:
                 raise ValueError("No requirements found! Check your input folder.")
                 
-            requirements = [
-                Requirement(
-                    req_id=r["req_id"], 
-                    title=r["title"], 
-                    description=r["description"],
-                    req_type=r.get("req_type", "functional")
-                ) 
-                for r in all_reqs
-            ]
+            from_row = Requirement.from_row
+            requirements = [from_row(r) for r in all_reqs]
             self.log(f"✓ Loaded {len(requirements)} requirements.", "success")
             
-            tests = []
+            # 2. AI Generation runs in the background while the rule engine
+            # builds the baseline, so the fallback is ready if the AI fails
+            from testgenai.rules.rule_engine import RuleEngine
             
-            # 2. AI Generation
-            if self.use_ai.get() and HAS_LLM_DEPS:
-                self.log("🤖 Connecting to AI (Edge Debug Port 9222)...", "info")
-                try:
-                    # Connect to existing browser
-                    copilot = CopilotSession(debug_port=self.debug_port.get())
-                    self.log("✓ Connected to Browser Session.", "success")
-                    
-                    # Send prompt
-                    req_dicts = [{"req_id": r.req_id, "description": r.description} for r in requirements]
-                    
-                    # TODO: Use upgraded prompt builder here
-                    prompt = build_prompt(req_dicts, [], "") 
-                    
-                    self.log(f"Sending {len(requirements)} requirements to AI...", "info")
-                    response_text = copilot.send_prompt(prompt, timeout_s=300) # Longer timeout
-                    copilot.close() # Detach
-                    
-                    self.log("✓ Received AI Response.", "success")
-                    
-                    ai_tests_data = parse_table_response(response_text)
-                    self.log(f"✓ AI returned {len(ai_tests_data)} test cases.", "success")
-                    
-                    from testgenai.orchestration.pipeline import _rows_to_tests
-                    tests = _rows_to_tests(ai_tests_data)
-                    
-                except Exception as e:
-                    self.log(f"❌ AI Failed: {e}", "error")
-                    self.log("Falling back to Rule Engine...", "warning")
+            engine = RuleEngine()
+            tests = []
+            with ThreadPoolExecutor(max_workers=1) as ex:
+                ai_future = None
+                if self.use_ai.get() and HAS_LLM_DEPS:
+                    ai_future = ex.submit(self.run_copilot, requirements)
+                
+                baseline_tests = engine.build_baseline_tests(requirements)
+                
+                if ai_future is not None:
+                    tests = ai_future.result()
             
             # 3. Fallback / Rule Engine
             if not tests:
-                engine = RuleEngine()
-                tests = engine.build_baseline_tests(requirements)
+                tests = baseline_tests
                 self.log("Generated baseline tests (Rule Engine).", "info")
+            else:
+                # AI tests win; the rule engine fills in requirements the AI
+                # left uncovered, whether its batch failed or it skipped them
+                from testgenai.orchestration.pipeline import _link_ai_requirements
+                missing = _link_ai_requirements(tests, requirements)
+                if missing:
+                    # The baseline already has one test per requirement
+                    missing_ids = {r.req_id for r in missing}
+                    tests.extend(tc for tc in baseline_tests if tc.requirements[0] in missing_ids)
+                    self.log(f"Generated baseline tests for {len(missing)} requirements not covered by AI (Rule Engine).", "info")
             
             # 4. Save using strict template writer
             out_path = Path(self.output_folder.get())
@@ -287,10 +503,20 @@ class TestGenAIGUI:
             filename = f"TestPlan_{timestamp}.xlsx"
             full_path = out_path / filename
             
+            from testgenai.mapping.traceability import build_trace_matrix
+            from testgenai.reports.stp_writer import write_stp_output
+            
             trace = build_trace_matrix(requirements, tests)
             
+            template = ""
+            if tpl:
+                try:
+                    template = self.template_source(tpl)
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Template file not found: {tpl}") from None
+            
             self.log(f"Saving to {filename}...", "info")
-            write_stp_output(self.template_path.get(), str(full_path), tests, trace, "Traceability")
+            write_stp_output(template, str(full_path), tests, trace, "Traceability")
             
             self.log("-" * 50)
             self.log("SUCCESS!", "success")
@@ -301,12 +527,102 @@ class TestGenAIGUI:
             self.log(f"CRITICAL ERROR: {e}", "error")
             self.root.after(0, lambda: messagebox.showerror("Failed", str(e)))
         finally:
-             self.root.after(0, lambda: self.generate_btn.config(state=tk.NORMAL, text="⚡ Generate Test Cases"))
+             self.root.after(0, self.finish_generation)
+
+    def finish_generation(self):
+        self.is_processing = False
+        self.generate_btn.config(state=tk.NORMAL, text="⚡ Generate Test Cases")
+        if not self.use_ai.get():
+            self.close_copilot()
+
+    def run_copilot(self, requirements):
+        """Generate tests through Copilot, one prompt per pack_requirements batch.
+
+        Requirements whose batch got no usable answer are left uncovered
+        for the rule engine to fill in.
+        """
+        try:
+            from testgenai.llm_copilot.prompt_builder import build_prompt, pack_requirements
+            from testgenai.llm_copilot.response_parser import parse_table_response
+            from testgenai.orchestration.pipeline import _rows_to_tests
+        except Exception as e:
+            self.log(f"❌ AI Failed: {e}", "error")
+            self.log("Falling back to Rule Engine...", "warning")
+            return []
+        
+        ai_tests_data, failed = [], []
+        batches = pack_requirements(requirements, AI_BATCH_TOKENS, AI_BATCH_SIZE)
+        for n, batch in enumerate(batches, start=1):
+            label = f"batch {n}/{len(batches)}"
+            try:
+                req_dicts = [{"req_id": r.req_id, "description": r.description} for r in batch]
+                
+                # TODO: Use upgraded prompt builder here
+                prompt = build_prompt(req_dicts, [], "") 
+                
+                response_text = self.ask_copilot(prompt, label)
+                rows = parse_table_response(response_text)
+                self.log(f"✓ AI {label}: {len(rows)} test cases.", "success")
+                
+                # Only responses that parsed into test cases are worth reusing
+                if rows:
+                    self.llm_cache.set(self.ai_url.get(), prompt, response_text)
+                    ai_tests_data.extend(rows)
+                else:
+                    failed.extend(batch)
+                
+            except Exception as e:
+                self.log(f"❌ AI {label} Failed: {e}", "error")
+                failed.extend(batch)
+        
+        self.log(f"AI cache: {self.stats['cache_hits']} hits, {self.stats['cache_misses']} misses")
+        if failed:
+            self.log(f"No AI answer for {len(failed)} requirements, leaving them to the Rule Engine...", "warning")
+        # Each batch numbers its answers from 1, so merged rows get fresh IDs
+        return _rows_to_tests(ai_tests_data, renumber=len(batches) > 1)
+
+    def ask_copilot(self, prompt, label):
+        # Identical requests are answered from the on-disk cache without
+        # opening the browser. Batches are stored as soon as they succeed, so
+        # a rerun after an interruption only sends the unfinished ones. With
+        # the cache switched off, fresh answers still replace stored ones.
+        response_text = self.llm_cache.get(self.ai_url.get(), prompt) if self.use_cache.get() else None
+        if response_text is not None:
+            self.stats["cache_hits"] += 1
+            self.log(f"✓ Reusing cached AI response for {label} (requirements unchanged).", "success")
+            return response_text
+        
+        self.stats["cache_misses"] += 1
+        # Held in a local so the worker never reads self.copilot again
+        # between connecting and sending
+        session = self.copilot
+        if session is None:
+            port = self.debug_port.get()
+            # Fail fast instead of waiting on the WebDriver connect timeout
+            if not debug_port_open(port):
+                raise RuntimeError(f"Edge is not listening on debug port {port}. Click 'Launch Browser & Login' first.")
+            self.log(f"🤖 Connecting to AI (Edge Debug Port {port})...", "info")
+            from testgenai.llm_copilot.copilot_session import CopilotSession
+            
+            # Connect to existing browser
+            session = self.copilot = CopilotSession(debug_port=port)
+            self.log("✓ Connected to Browser Session.", "success")
+        
+        self.log(f"Sending {label} to AI...", "info")
+        try:
+            response_text = session.send_prompt(prompt, timeout_s=AI_BATCH_TIMEOUT_S)
+        except Exception:
+            # Reconnect next time rather than reuse a broken session
+            self.close_copilot()
+            raise
+        
+        self.log("✓ Received AI Response.", "success")
+        return response_text
 
     def ask_open(self, path):
         if messagebox.askyesno("Open File", "Open the generated Test Plan?"):
-            import os
-            os.startfile(str(path))
+            # The shell can take a while to find the handler; keep Tk responsive
+            threading.Thread(target=os.startfile, args=(str(path),), daemon=True).start()
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -2,7 +2,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from testgenai.ingestion.doc_parser import load_requirements_from_sources
+from testgenai.ingestion.doc_parser import load_requirements, load_requirements_from_sources
 
 
 class DocParserTests(unittest.TestCase):
@@ -28,6 +28,23 @@ class DocParserTests(unittest.TestCase):
             self.assertTrue(any("Function behavior: compute_speed" in d for d in descriptions))
             self.assertTrue(any("Constraint: MAX_RPM" in d for d in descriptions))
 
+    def test_load_requirements_from_docx(self) -> None:
+        try:
+            from docx import Document
+        except ImportError:
+            self.skipTest("python-docx not installed")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            doc_path = Path(tmp) / "spec.docx"
+            doc = Document()
+            doc.add_paragraph("REQ-7: Pump shall stop when water is detected")
+            doc.save(doc_path)
+
+            requirements = load_requirements(str(doc_path))
+
+            self.assertEqual(requirements[0]["req_id"], "REQ-7")
+            self.assertEqual(requirements[0]["description"], "Pump shall stop when water is detected")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,22 @@
+import tempfile
+import unittest
+
+from testgenai.llm_copilot.cache import LLMCache
+
+
+class LLMCacheTests(unittest.TestCase):
+    def test_roundtrip_is_keyed_by_url_and_prompt(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = LLMCache(tmp)
+            self.assertIsNone(cache.get("https://copilot", "prompt"))
+
+            cache.set("https://copilot", "prompt", "| TC-1 | ... |")
+            self.assertEqual(cache.get("https://copilot", "prompt"), "| TC-1 | ... |")
+            self.assertIsNone(cache.get("https://other", "prompt"))
+
+            reopened = LLMCache(tmp)
+            self.assertEqual(reopened.get("https://copilot", "prompt"), "| TC-1 | ... |")
+
+
+if __name__ == "__main__":
+    unittest.main()
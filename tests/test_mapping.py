@@ -13,6 +13,10 @@ class MappingTests(unittest.TestCase):
         matrix = build_trace_matrix(reqs, tests)
         self.assertEqual(matrix["REQ-1"], ["TC-1"])
 
+    def test_requirement_from_row_defaults_type(self) -> None:
+        req = Requirement.from_row({"req_id": "REQ-2", "title": "B", "description": "Desc"})
+        self.assertEqual(req, Requirement("REQ-2", "B", "Desc", "functional"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from testgenai.mapping.traceability import build_trace_matrix
+from testgenai.models.requirement import Requirement
+from testgenai.orchestration.pipeline import _link_ai_requirements, _rows_to_tests
+
+
+class RowsToTestsTests(unittest.TestCase):
+    def test_merged_batches_get_unique_test_ids(self) -> None:
+        batch_1 = [{"test_id": "TC-001", "title": "A", "requirements": "REQ-1"}]
+        batch_2 = [{"test_id": "TC-001", "title": "B", "requirements": "REQ-2"}]
+        tests = _rows_to_tests(batch_1 + batch_2, renumber=True)
+
+        self.assertEqual([tc.test_id for tc in tests], ["LLM-TC-1", "LLM-TC-2"])
+        reqs = [Requirement("REQ-1", "A", "", "functional"), Requirement("REQ-2", "B", "", "functional")]
+        matrix = build_trace_matrix(reqs, tests)
+        self.assertEqual(matrix, {"REQ-1": ["LLM-TC-1"], "REQ-2": ["LLM-TC-2"]})
+
+    def test_single_response_keeps_model_ids(self) -> None:
+        tests = _rows_to_tests([{"test_id": "TC-007", "requirements": "REQ-1"}])
+        self.assertEqual(tests[0].test_id, "TC-007")
+
+    def test_ai_requirement_ids_are_linked_loosely(self) -> None:
+        reqs = [
+            Requirement("REQ-1", "A", "", "functional"),
+            Requirement("REQ-2", "B", "", "functional"),
+            Requirement("REQ-3", "C", "", "functional"),
+        ]
+        tests = _rows_to_tests([{"requirements": " req-1 *, REQ - 2"}, {"requirements": "REQ-9"}])
+
+        missing = _link_ai_requirements(tests, reqs)
+
+        self.assertEqual([r.req_id for r in missing], ["REQ-3"])
+        self.assertEqual(tests[0].requirements, ["REQ-1", "REQ-2"])
+        self.assertEqual(tests[0].steps[0].requirement_ids, ["REQ-1", "REQ-2"])
+        self.assertEqual(tests[1].requirements, ["REQ-9"])
+        matrix = build_trace_matrix(reqs, tests)
+        self.assertEqual(matrix["REQ-1"], ["LLM-TC-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from testgenai.llm_copilot.prompt_builder import build_prompt, build_prompt_parts, pack_requirements
+
+
+class PromptBuilderTests(unittest.TestCase):
+    def test_static_prefix_is_shared_and_requirements_come_last(self) -> None:
+        schema = {"columns": ["Test ID", "Title"]}
+        prefix_a, suffix_a = build_prompt_parts([{"req_id": "REQ-1", "description": "A"}], [], "", schema)
+        prefix_b, suffix_b = build_prompt_parts([{"req_id": "REQ-2", "description": "B"}], [], "", schema)
+
+        self.assertEqual(prefix_a, prefix_b)
+        self.assertIn("Test ID, Title", prefix_a)
+        self.assertNotIn("REQ-1", prefix_a)
+        self.assertIn("- **REQ-1**: A", suffix_a)
+        self.assertIn("- **REQ-2**: B", suffix_b)
+
+        prompt = build_prompt([{"req_id": "REQ-1", "description": "A"}], [], "", schema)
+        self.assertEqual(prompt, f"{prefix_a}\n{suffix_a}")
+
+    def test_pack_requirements_respects_token_budget_and_count(self) -> None:
+        reqs = [{"req_id": f"REQ-{i}", "description": "x" * size} for i, size in enumerate([40, 40, 400, 40, 40, 40])]
+
+        batches = pack_requirements(reqs, token_budget=100, max_items=2)
+
+        self.assertEqual([[r["req_id"] for r in b] for b in batches],
+                         [["REQ-0", "REQ-1"], ["REQ-2"], ["REQ-3", "REQ-4"], ["REQ-5"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
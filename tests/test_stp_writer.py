@@ -1,3 +1,4 @@
+import io
 import tempfile
 import unittest
 from pathlib import Path
@@ -47,6 +48,58 @@ class StpWriterTests(unittest.TestCase):
             self.assertEqual(trace.cell(row=1, column=1).value, "Requirement ID")
             self.assertEqual(trace.cell(row=2, column=1).value, "REQ-1")
 
+    def test_write_stp_output_reads_template_from_file_object(self) -> None:
+        step = TestStep(step_id="S1", action="Do", expected="Ok", requirement_ids=["REQ-1"])
+        test = TestCase(
+            test_id="TC-1",
+            title="Title",
+            preconditions="IGN ON",
+            steps=[step],
+            requirements=["REQ-1"],
+        )
+
+        wb = openpyxl.Workbook()
+        sheet = wb.active
+        sheet.title = "Plan"
+        sheet.cell(row=1, column=1, value="Test ID")
+        sheet.cell(row=1, column=2, value="Title")
+        sheet.cell(row=2, column=1, value="OLD-TC")
+        template = io.BytesIO()
+        wb.save(template)
+        template.seek(0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.xlsx"
+
+            write_stp_output(template, str(out_path), [test], {"REQ-1": ["TC-1"]}, "Trace")
+
+            out_sheet = openpyxl.load_workbook(out_path)["Plan"]
+            self.assertEqual(out_sheet.cell(row=2, column=1).value, "TC-1")
+            self.assertEqual(out_sheet.cell(row=2, column=2).value, "Title")
+
+    def test_write_stp_output_without_template_uses_default_headers(self) -> None:
+        step = TestStep(step_id="S1", action="Do", expected="Ok", requirement_ids=["REQ-1"])
+        test = TestCase(
+            test_id="TC-1",
+            title="Title",
+            preconditions="IGN ON",
+            steps=[step],
+            requirements=["REQ-1"],
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.xlsx"
+
+            write_stp_output("", str(out_path), [test], {"REQ-1": ["TC-1"]}, "Trace")
+
+            out_wb = openpyxl.load_workbook(out_path)
+            plan = out_wb["Test Plan"]
+            self.assertEqual(plan.cell(row=1, column=1).value, "Test ID")
+            self.assertEqual(plan.cell(row=2, column=1).value, "TC-1")
+            self.assertEqual(plan.cell(row=2, column=5).value, "1. Do")
+            self.assertEqual(plan.cell(row=2, column=6).value, "1. Ok")
+            self.assertEqual(out_wb["Trace"].cell(row=2, column=2).value, "TC-1")
+
 
 if __name__ == "__main__":
     unittest.main()
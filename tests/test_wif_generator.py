@@ -0,0 +1,35 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from testgenai.wif_ecm.generator import WIFTestCaseGenerator
+
+
+class WIFGeneratorLoadTests(unittest.TestCase):
+    def test_duplicate_id_in_one_sheet_keeps_first_position_and_last_row(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            req_path = Path(tmp) / "reqs.xlsx"
+            rows = pd.DataFrame({
+                "req_id": ["SYS_WIF_001", "SYS_WIF_002", "SYS_WIF_001"],
+                "description": ["First row", "Second requirement", "Replacement row"],
+            })
+            with pd.ExcelWriter(req_path) as writer:
+                rows.to_excel(writer, sheet_name=WIFTestCaseGenerator.SYSTEM_SHEET, index=False)
+
+            streamed = WIFTestCaseGenerator(str(req_path), str(Path(tmp) / "streamed"))
+            streamed._load_requirements(on_requirement=streamed._emit_test_case)
+
+            separate = WIFTestCaseGenerator(str(req_path), str(Path(tmp) / "separate"))
+            separate._load_requirements()
+            separate.generate_system_test_cases()
+
+            ids = [tc.test_case_id for tc in streamed.test_cases]
+            self.assertEqual(ids, ["TC_SYS_SYS_WIF_001_001", "TC_SYS_SYS_WIF_002_001"])
+            self.assertEqual(ids, [tc.test_case_id for tc in separate.test_cases])
+            self.assertEqual(streamed.test_cases[0].requirement_description, "Replacement row")
+
+
+if __name__ == "__main__":
+    unittest.main()
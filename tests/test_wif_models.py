@@ -0,0 +1,39 @@
+import json
+import unittest
+
+from testgenai.wif_ecm.generator import _json_default, orjson
+from testgenai.wif_ecm.models import (
+    ASILLevel,
+    RequirementType,
+    TestEnvironment,
+    Traceability,
+    WIFTestCase,
+    WIFTestStep,
+)
+
+
+class WIFModelSerializationTests(unittest.TestCase):
+    @unittest.skipIf(orjson is None, "orjson not installed")
+    def test_orjson_dataclass_output_matches_to_dict(self) -> None:
+        tc = WIFTestCase(
+            test_case_id="TC_DIAG_DIAG_WIF_001_001",
+            type=RequirementType.DIAGNOSTIC,
+            requirement_id="DIAG_WIF_001",
+            requirement_description="DTC P242F shall be set — water detected",
+            test_objective="Verify DTC P242F",
+            preconditions=["IGN ON"],
+            test_steps=[WIFTestStep(step_no=1, action="Set 800 Ω", expected_result="DTC = P242F")],
+            pass_criteria="DTC P242F stored",
+            traceability=Traceability(diagnostic_req="DIAG_WIF_001", a2l_reference="CAL_WIF_Thr"),
+            test_environment=TestEnvironment.SIL,
+            asil_level=ASILLevel.ASIL_A,
+            dtc_code="P242F",
+        )
+
+        fast = orjson.dumps([tc], default=_json_default, option=orjson.OPT_INDENT_2)
+        expected = json.dumps([tc.to_dict()], indent=2, ensure_ascii=False).encode("utf-8")
+        self.assertEqual(fast, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
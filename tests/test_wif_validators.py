@@ -0,0 +1,103 @@
+import unittest
+
+from testgenai.wif_ecm.models import (
+    ASILLevel,
+    RequirementType,
+    Traceability,
+    WIFRequirement,
+    WIFTestCase,
+    WIFTestStep,
+)
+from testgenai.wif_ecm.validators import TestCaseValidator
+
+
+def _make_test_case(steps) -> WIFTestCase:
+    return WIFTestCase(
+        test_case_id="TC_SYS_SYS_WIF_001_001",
+        type=RequirementType.SYSTEM,
+        requirement_id="SYS_WIF_001",
+        requirement_description="Water shall be detected",
+        test_objective="Verify that water shall be detected",
+        test_steps=steps,
+        pass_criteria="WIF_Status flag = 1 within 200ms",
+        traceability=Traceability(system_req="SYS_WIF_001"),
+        asil_level=ASILLevel.ASIL_A,
+    )
+
+
+class WIFValidatorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        req = WIFRequirement(
+            req_id="SYS_WIF_001",
+            description="Water shall be detected",
+            req_type=RequirementType.SYSTEM,
+            asil_level=ASILLevel.ASIL_A,
+        )
+        self.validator = TestCaseValidator({req.req_id: req})
+
+    def test_vague_steps_reported_once_per_field(self) -> None:
+        steps = [WIFTestStep(step_no=1, action="Check", expected_result="Works as expected")]
+        is_valid, errors = self.validator.validate_test_case(_make_test_case(steps))
+        error_types = [e.error_type for e in errors]
+        self.assertFalse(is_valid)
+        self.assertEqual(error_types.count("VAGUE_ACTION"), 1)
+        self.assertEqual(error_types.count("VAGUE_EXPECTED_RESULT"), 1)
+        self.assertIn("NON_MEASURABLE_RESULT", error_types)
+
+    def test_specific_step_is_valid(self) -> None:
+        steps = [WIFTestStep(step_no=1, action="Set resistance to 800 ohms", expected_result="WIF_Status = 1")]
+        is_valid, errors = self.validator.validate_test_case(_make_test_case(steps))
+        self.assertTrue(is_valid)
+        self.assertEqual(errors, [])
+
+    def test_test_case_id_format_depends_on_type(self) -> None:
+        tc = _make_test_case([])
+        self.assertTrue(self.validator._validate_test_case_id(tc))
+
+        tc.test_case_id = "TC_SW_SW_WIF_001_001"
+        self.assertFalse(self.validator._validate_test_case_id(tc))
+
+    def test_validate_all_collects_errors_in_input_order(self) -> None:
+        good = _make_test_case([WIFTestStep(step_no=1, action="Set 800 ohms", expected_result="WIF_Status = 1")])
+        bad = _make_test_case([WIFTestStep(step_no=1, action="Check", expected_result="Works as expected")])
+        bad.test_case_id = "TC_BAD"
+        no_steps = _make_test_case([])
+        no_steps.test_case_id = "TC_NO_STEPS"
+
+        all_valid, errors = self.validator.validate_all([good, bad, good, no_steps])
+
+        self.assertFalse(all_valid)
+        self.assertEqual(
+            [(e.test_case_id, e.error_type) for e in errors],
+            [
+                ("TC_BAD", "INVALID_ID_FORMAT"),
+                ("TC_BAD", "VAGUE_ACTION"),
+                ("TC_BAD", "VAGUE_EXPECTED_RESULT"),
+                ("TC_BAD", "NON_MEASURABLE_RESULT"),
+                ("TC_NO_STEPS", "INVALID_ID_FORMAT"),
+                ("TC_NO_STEPS", "NO_TEST_STEPS"),
+            ],
+        )
+        self.assertEqual(self.validator.errors, errors)
+
+    def test_validate_coverage_counts_and_uncovered(self) -> None:
+        diag = WIFRequirement(
+            req_id="DIAG_WIF_001",
+            description="Store DTC P242F",
+            req_type=RequirementType.DIAGNOSTIC,
+        )
+        self.validator.requirements[diag.req_id] = diag
+        validator = TestCaseValidator(self.validator.requirements)
+
+        report = validator.validate_coverage([_make_test_case([])])
+
+        self.assertEqual(report.total_requirements, 2)
+        self.assertEqual(report.system_test_cases, 1)
+        self.assertEqual(report.diagnostic_test_cases, 0)
+        self.assertEqual(report.uncovered_requirements, ["DIAG_WIF_001"])
+        self.assertEqual(report.coverage_percentage, 50.0)
+        self.assertFalse(report.is_complete())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import openpyxl
+from openpyxl.styles import Font, PatternFill
+
+from testgenai.wif_ecm.xlsx_stream import StreamingWorkbook
+
+
+class StreamingWorkbookTests(unittest.TestCase):
+    def test_roundtrip_values_styles_and_layout(self) -> None:
+        fill = PatternFill(start_color="27AE60", end_color="27AE60", fill_type="solid")
+        bold = Font(bold=True, size=14)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.xlsx"
+
+            wb = StreamingWorkbook()
+            ws = wb.create_sheet("Matrix")
+            ws.column_dimensions['A'].width = 25
+            ws.merged_cells.add('A1:C1')
+            ws.append([ws.styled("Title", font=bold)])
+            ws.append([])
+            ws.append(["REQ-1", " <padded> & ", ws.styled("COVERED", fill=fill), 3, ""])
+            wb.save(out_path)
+
+            sheet = openpyxl.load_workbook(out_path)["Matrix"]
+            self.assertEqual(sheet["A1"].value, "Title")
+            self.assertTrue(sheet["A1"].font.b)
+            self.assertEqual(sheet["A1"].font.sz, 14)
+            self.assertIsNone(sheet["A2"].value)
+            self.assertEqual(sheet["B3"].value, " <padded> & ")
+            self.assertEqual(sheet["C3"].fill.fgColor.rgb, "0027AE60")
+            self.assertEqual(sheet["D3"].value, 3)
+            self.assertIsNone(sheet["E3"].value)
+            self.assertEqual(sheet.column_dimensions['A'].width, 25)
+            self.assertEqual([str(r) for r in sheet.merged_cells.ranges], ["A1:C1"])
+
+    def test_equal_styles_share_one_format_and_non_finite_floats_are_blank(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "out.xlsx"
+
+            wb = StreamingWorkbook()
+            ws = wb.create_sheet("Matrix")
+            first = ws.styled("a", font=Font(bold=True))
+            second = ws.styled("b", font=Font(bold=True))
+            self.assertEqual(first.style_id, second.style_id)
+            ws.append([first, float("nan"), float("inf"), 1.5])
+            wb.save(out_path)
+
+            sheet = openpyxl.load_workbook(out_path)["Matrix"]
+            self.assertTrue(sheet["A1"].font.b)
+            self.assertIsNone(sheet["B1"].value)
+            self.assertIsNone(sheet["C1"].value)
+            self.assertEqual(sheet["D1"].value, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()